@@ -2,21 +2,37 @@
 Hologres MCP Server - FastMCP v3 Implementation
 """
 
+import asyncio
 import base64
+import functools
+import threading
+import time
 from typing import Annotated
 
 from fastmcp import FastMCP
 from fastmcp.server.lifespan import lifespan
+from psycopg import sql
 
 from hologres_mcp_server.settings import SERVER_VERSION
 from hologres_mcp_server.utils import (
-    SYSTEM_SCHEMAS_EXCLUDED,
+    LIST_SCHEMAS_QUERY,
+    LIST_TABLES_QUERY,
+    MAX_QUERY_LOG_ROWS,
+    MISSING_STATS_QUERY,
+    STAT_ACTIVITY_QUERY,
+    TABLE_DDL_QUERY,
+    TABLE_PARTITIONS_QUERY,
+    TABLE_STATISTIC_HEADERS,
+    TABLE_STATISTIC_QUERY,
+    async_connect_with_retry,
+    close_pool,
     connect_with_retry,
     format_tabular_result,
-    get_list_schemas_query,
-    get_list_tables_query,
     handle_call_tool,
+    handle_copy_resource,
     handle_read_resource,
+    open_pool,
+    quote_qualified_name,
     try_infer_view_comments,
     validate_ddl_query,
     validate_dml_query,
@@ -30,14 +46,21 @@ from hologres_mcp_server.utils import (
 
 @lifespan
 async def validate_connection(server):
-    """Validate database connection on server startup."""
+    """Validate database connection on server startup and own the connection pool lifetime."""
     try:
-        conn = connect_with_retry(retries=1)
-        conn.close()
+        conn = await async_connect_with_retry(retries=1)
+        await conn.close()
         print("Database connection validated successfully.")
     except Exception as e:
         print(f"Warning: Database connection validation failed: {e}")
-    yield {}
+    # Pool setup and teardown are blocking (close() joins the pool workers), so
+    # keep them off the event loop. Sync tools and static resources already run
+    # in FastMCP's worker threads; URI templates go through _templated_resource.
+    await asyncio.to_thread(open_pool)
+    try:
+        yield {}
+    finally:
+        await asyncio.to_thread(close_pool)
 
 
 app = FastMCP(
@@ -61,7 +84,7 @@ app = FastMCP(
 def execute_hg_select_sql(query: Annotated[str, "The (SELECT) SQL query to execute in Hologres database."]) -> str:
     """Execute SELECT SQL to query data from Hologres database."""
     validate_select_query(query)
-    return handle_call_tool("execute_hg_select_sql", query, serverless=False)
+    return handle_call_tool("execute_hg_select_sql", query, serverless=False, csv_output=True)
 
 
 @app.tool(tags={"query"})
@@ -70,7 +93,7 @@ def execute_hg_select_sql_with_serverless(
 ) -> str:
     """Use Serverless Computing resources to execute SELECT SQL to query data in Hologres database. When the error like 'Total memory used by all existing queries exceeded memory limitation' occurs during execute_hg_select_sql execution, you can re-execute the SQL with this tool."""
     validate_select_query(query)
-    return handle_call_tool("execute_hg_select_sql_with_serverless", query, serverless=True)
+    return handle_call_tool("execute_hg_select_sql_with_serverless", query, serverless=True, csv_output=True)
 
 
 @app.tool(tags={"dml"})
@@ -84,7 +107,10 @@ def execute_hg_dml_sql(query: Annotated[str, "The DML SQL query to execute in Ho
 def execute_hg_ddl_sql(query: Annotated[str, "The DDL SQL query to execute in Hologres database"]) -> str:
     """Execute (CREATE, ALTER, DROP) SQL statements to CREATE, ALTER, or DROP tables, views, procedures, GUCs etc. in Hologres database."""
     validate_ddl_query(query)
-    return handle_call_tool("execute_hg_ddl_sql", query, serverless=False)
+    try:
+        return handle_call_tool("execute_hg_ddl_sql", query, serverless=False)
+    finally:
+        invalidate_listing_cache()
 
 
 @app.tool(tags={"admin"})
@@ -93,8 +119,11 @@ def gather_hg_table_statistics(
     table: Annotated[str, "Table name in Hologres database"],
 ) -> str:
     """Execute the ANALYZE TABLE command to have Hologres collect table statistics, enabling QO to generate better query plans."""
-    query = f"ANALYZE {schema_name}.{table}"
-    return handle_call_tool("gather_hg_table_statistics", query, serverless=False)
+    query = sql.SQL("ANALYZE {}").format(sql.Identifier(schema_name, table))
+    try:
+        return handle_call_tool("gather_hg_table_statistics", query, serverless=False)
+    finally:
+        invalidate_listing_cache()
 
 
 @app.tool(tags={"analysis"})
@@ -143,13 +172,16 @@ def create_hg_maxcompute_foreign_table(
         FROM SERVER odps_server
         INTO {local_schema};
     """
-    return handle_call_tool("create_hg_maxcompute_foreign_table", query, serverless=False)
+    try:
+        return handle_call_tool("create_hg_maxcompute_foreign_table", query, serverless=False)
+    finally:
+        invalidate_listing_cache()
 
 
 @app.tool(tags={"schema"})
 def list_hg_schemas() -> str:
     """List all schemas in the current Hologres database, excluding system schemas."""
-    return handle_call_tool("list_hg_schemas", get_list_schemas_query(), serverless=False)
+    return handle_call_tool("list_hg_schemas", LIST_SCHEMAS_QUERY, serverless=False, prepare=True)
 
 
 @app.tool(tags={"schema"})
@@ -157,7 +189,9 @@ def list_hg_tables_in_a_schema(
     schema_name: Annotated[str, "Schema name to list tables from in Hologres database"],
 ) -> str:
     """List all tables in a specific schema in the current Hologres database, including their types (table, view, foreign table, partitioned table)."""
-    return handle_call_tool("list_hg_tables_in_a_schema", get_list_tables_query(schema_name), serverless=False)
+    return handle_call_tool(
+        "list_hg_tables_in_a_schema", LIST_TABLES_QUERY, serverless=False, params=[schema_name], prepare=True
+    )
 
 
 @app.tool(tags={"schema"})
@@ -166,11 +200,11 @@ def show_hg_table_ddl(
     table: Annotated[str, "Table name in Hologres database"],
 ) -> str:
     """Show DDL script for a table, view, or foreign table in Hologres database."""
-    query = f'SELECT hg_dump_script(\'"{schema_name}"."{table}"\')'
-    result = handle_call_tool("show_hg_table_ddl", query, serverless=False)
+    params = [quote_qualified_name(schema_name, table)]
+    result = handle_call_tool("show_hg_table_ddl", TABLE_DDL_QUERY, serverless=False, params=params, prepare=True)
 
     if "Type: VIEW" in result:
-        ddl = handle_read_resource("list_ddl", query)
+        ddl = handle_read_resource("list_ddl", TABLE_DDL_QUERY, params=params, prepare=True)
         if ddl and ddl[0]:
             return _build_view_ddl_with_comments(schema_name, table, ddl[0][0])
     return result
@@ -236,7 +270,10 @@ def restore_hg_table_from_recyclebin(
     schema_name: Annotated[str, "Schema name of the table (default 'public')"] = "public",
 ) -> str:
     """Restore a dropped table from the Hologres recycle bin. Only works if the table is still in the recycle bin."""
-    return _restore_from_recyclebin(schema_name, table_name)
+    try:
+        return _restore_from_recyclebin(schema_name, table_name)
+    finally:
+        invalidate_listing_cache()
 
 
 @app.tool(tags={"admin"})
@@ -431,30 +468,84 @@ def get_hg_guc_config(
 # ============================================================================
 
 
-def _query_resource_as_table(resource_name, query, empty_message="No data found"):
-    """Execute a resource query and return formatted tabular output.
+# Schema/table listings and missing_stats_tables only change on DDL or ANALYZE,
+# so repeated reads within the TTL reuse the result. DDL and ANALYZE run through
+# this server drop the cache immediately.
+LISTING_CACHE_TTL = 30  # seconds
+LISTING_CACHE_MAXSIZE = 256
+_listing_cache = {}
+# Bumped on every invalidation so a read that raced a DDL never stores stale rows
+_listing_cache_generation = 0
+_listing_cache_lock = threading.Lock()
+
+
+def _cached_read(key, read):
+    """Return ``read()``, reusing a successful (non-error-string) result for LISTING_CACHE_TTL seconds."""
+    now = time.monotonic()
+    cached = _listing_cache.get(key)
+    if cached is not None and now - cached[0] < LISTING_CACHE_TTL:
+        return cached[1]
+    generation = _listing_cache_generation
+    result = read()
+    if not isinstance(result, str):
+        with _listing_cache_lock:
+            if generation == _listing_cache_generation:
+                if len(_listing_cache) >= LISTING_CACHE_MAXSIZE:
+                    _listing_cache.clear()
+                _listing_cache[key] = (now, result)
+    return result
+
+
+def _read_listing(resource_name, query, params=None):
+    """Run a catalog listing through handle_read_resource, caching successful rows."""
+    return _cached_read(
+        (resource_name, *(params or ())),
+        lambda: handle_read_resource(resource_name, query, params=params, prepare=True),
+    )
 
-    Handles error strings from handle_read_resource gracefully.
+
+def invalidate_listing_cache():
+    """Drop cached listings (called after DDL and ANALYZE)."""
+    global _listing_cache_generation
+    with _listing_cache_lock:
+        _listing_cache_generation += 1
+        _listing_cache.clear()
+
+
+def _query_resource_as_table(resource_name, query, empty_message="No data found", params=None, cached=False):
+    """Execute a resource query and return tab-separated output serialized by COPY.
+
+    Handles error strings from handle_copy_resource gracefully. ``cached=True``
+    serves the result through the listing cache.
     """
-    result = handle_read_resource(resource_name, query, with_headers=True)
+
+    def read():
+        return handle_copy_resource(resource_name, query, params=params)
+
+    result = _cached_read((resource_name, *(params or ())), read) if cached else read()
     if isinstance(result, str):
         return result
-    rows, headers = result
-    if not rows:
+    text, has_rows = result
+    if not has_rows:
         return empty_message
-    return format_tabular_result(rows, headers)
+    return text
 
 
-def _query_log_resource(resource_name, where_clauses, row_limits):
-    """Shared handler for query log resources."""
-    limit, error = validate_positive_integer(row_limits)
+def _query_log_resource(resource_name, where_clauses, params, row_limits):
+    """Shared handler for query log resources.
+
+    Filter values and the row limit are bound as parameters rather than
+    formatted into the SQL. The limit is capped at MAX_QUERY_LOG_ROWS so a
+    single read cannot buffer an unbounded slice of hg_query_log.
+    """
+    limit, error = validate_positive_integer(row_limits, max_value=MAX_QUERY_LOG_ROWS)
     if error:
         return error
     where_sql = " AND ".join(where_clauses)
     if where_sql:
         where_sql = " WHERE " + where_sql
-    query = f"SELECT * FROM hologres.hg_query_log{where_sql} ORDER BY query_start DESC LIMIT {limit}"
-    return _query_resource_as_table(resource_name, query, "No query logs found")
+    query = f"SELECT * FROM hologres.hg_query_log{where_sql} ORDER BY query_start DESC LIMIT %s"
+    return _query_resource_as_table(resource_name, query, "No query logs found", params=[*params, limit])
 
 
 def _build_view_ddl_with_comments(schema, table, raw_ddl):
@@ -615,6 +706,9 @@ def _analyze_query_by_id(query_id):
 
 def _get_slow_queries(min_duration_ms, limit):
     """Get slow queries from hg_query_log."""
+    limit, error = validate_positive_integer(limit, "Limit", max_value=MAX_QUERY_LOG_ROWS)
+    if error:
+        return f"Error: {error}"
     try:
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
@@ -690,6 +784,9 @@ def _list_dynamic_tables(schema_name=""):
 
 def _get_dynamic_table_refresh_history(schema_name, table_name, limit=10):
     """Get refresh history for a specific Dynamic Table."""
+    limit, error = validate_positive_integer(limit, "Limit")
+    if error:
+        return f"Error: {error}"
     try:
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
@@ -795,12 +892,9 @@ def _list_warehouses():
     """List all computing groups (warehouses)."""
     try:
         with connect_with_retry() as conn:
-            with conn.cursor() as cursor:
-                # Get current warehouse
-                cursor.execute("SHOW hg_computing_resource")
-                current = cursor.fetchone()[0] if cursor.description else "unknown"
-
-                # Get all warehouses
+            with conn.pipeline(), conn.cursor() as current_cursor, conn.cursor() as cursor:
+                # Current warehouse and the warehouse list go out in one round-trip
+                current_cursor.execute("SHOW hg_computing_resource")
                 cursor.execute(
                     """
                     SELECT
@@ -815,6 +909,7 @@ def _list_warehouses():
                     ORDER BY warehouse_id
                     """
                 )
+                current = current_cursor.fetchone()[0] if current_cursor.description else "unknown"
                 rows = cursor.fetchall()
 
                 if not rows:
@@ -971,28 +1066,29 @@ def _list_query_queues():
     """List all Query Queues and classifiers."""
     try:
         with connect_with_retry() as conn:
-            with conn.cursor() as cursor:
-                # Get query queues
-                cursor.execute(
+            # Both catalog reads are independent: pipeline them on separate
+            # cursors so they share a single round-trip.
+            with conn.pipeline(), conn.cursor() as queue_cursor, conn.cursor() as classifier_cursor:
+                queue_cursor.execute(
                     """
                     SELECT *
                     FROM hologres.hg_query_queues
                     ORDER BY query_queue_name
                     """
                 )
-                queue_rows = cursor.fetchall()
-                queue_headers = [desc[0] for desc in cursor.description] if cursor.description else []
-
-                # Get classifiers
-                cursor.execute(
+                classifier_cursor.execute(
                     """
                     SELECT *
                     FROM hologres.hg_classifiers
                     ORDER BY classifier_name
                     """
                 )
-                classifier_rows = cursor.fetchall()
-                classifier_headers = [desc[0] for desc in cursor.description] if cursor.description else []
+                queue_rows = queue_cursor.fetchall()
+                queue_headers = [desc[0] for desc in queue_cursor.description] if queue_cursor.description else []
+                classifier_rows = classifier_cursor.fetchall()
+                classifier_headers = (
+                    [desc[0] for desc in classifier_cursor.description] if classifier_cursor.description else []
+                )
 
                 parts = ["## Query Queues"]
 
@@ -1179,6 +1275,9 @@ def _get_lock_diagnostics():
 
 def _get_table_info_trend(schema_name, table, days=7):
     """Get table storage trend from hologres.hg_table_info."""
+    days, error = validate_positive_integer(days, "Days")
+    if error:
+        return f"Error: {error}"
     try:
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
@@ -1224,14 +1323,15 @@ def _manage_query_queue(action, queue_name, max_concurrency=0, max_queue_size=0)
     """Create, drop, or clear a Query Queue."""
     try:
         action = action.lower().strip()
+        if action not in ("create", "drop", "clear"):
+            return f"Unknown action '{action}'. Supported: 'create', 'drop', 'clear'."
+        if action == "create" and (max_concurrency <= 0 or max_queue_size <= 0):
+            return "Error: max_concurrency and max_queue_size must be positive integers for 'create' action."
+
         safe_name = queue_name.replace("'", "''")
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
                 if action == "create":
-                    if max_concurrency <= 0 or max_queue_size <= 0:
-                        return (
-                            "Error: max_concurrency and max_queue_size must be positive integers for 'create' action."
-                        )
                     cursor.execute(
                         f"CALL hg_create_query_queue('{safe_name}', {int(max_concurrency)}, {int(max_queue_size)})"
                     )
@@ -1239,11 +1339,9 @@ def _manage_query_queue(action, queue_name, max_concurrency=0, max_queue_size=0)
                 elif action == "drop":
                     cursor.execute(f"CALL hg_drop_query_queue('{safe_name}')")
                     return f"Successfully dropped query queue '{queue_name}'."
-                elif action == "clear":
+                else:
                     cursor.execute(f"CALL hg_clear_query_queue('{safe_name}')")
                     return f"Successfully cleared all queued requests in queue '{queue_name}'."
-                else:
-                    return f"Unknown action '{action}'. Supported: 'create', 'drop', 'clear'."
     except Exception as e:
         return f"Error managing query queue: {str(e)}"
 
@@ -1252,6 +1350,9 @@ def _manage_classifier(action, queue_name, classifier_name, priority=0):
     """Create or drop a classifier."""
     try:
         action = action.lower().strip()
+        if action not in ("create", "drop"):
+            return f"Unknown action '{action}'. Supported: 'create', 'drop'."
+
         safe_queue = queue_name.replace("'", "''")
         safe_classifier = classifier_name.replace("'", "''")
         with connect_with_retry() as conn:
@@ -1259,11 +1360,9 @@ def _manage_classifier(action, queue_name, classifier_name, priority=0):
                 if action == "create":
                     cursor.execute(f"CALL hg_create_classifier('{safe_queue}', '{safe_classifier}', {int(priority)})")
                     return f"Successfully created classifier '{classifier_name}' in queue '{queue_name}' (priority={priority})."
-                elif action == "drop":
+                else:
                     cursor.execute(f"CALL hg_drop_classifier('{safe_queue}', '{safe_classifier}')")
                     return f"Successfully dropped classifier '{classifier_name}' from queue '{queue_name}'."
-                else:
-                    return f"Unknown action '{action}'. Supported: 'create', 'drop'."
     except Exception as e:
         return f"Error managing classifier: {str(e)}"
 
@@ -1273,6 +1372,13 @@ def _set_query_queue_property(target, queue_name, property_key, property_value,
     try:
         target = target.lower().strip()
         action = action.lower().strip()
+        if target not in ("queue", "classifier"):
+            return f"Unknown target '{target}'. Supported: 'queue', 'classifier'."
+        if target == "classifier" and not classifier_name:
+            return "Error: classifier_name is required when target='classifier'."
+        if action not in ("set", "remove"):
+            return f"Unknown action '{action}'. Supported: 'set', 'remove'."
+
         safe_queue = queue_name.replace("'", "''")
         safe_key = property_key.replace("'", "''")
         safe_value = property_value.replace("'", "''")
@@ -1288,62 +1394,58 @@ def _set_query_queue_property(target, queue_name, property_key, property_value,
                             f"CALL hg_set_query_queue_property('{safe_queue}', '{safe_key}', '{safe_value}')"
                         )
                         return f"Successfully set queue '{queue_name}' property '{property_key}' = '{property_value}'."
-                    elif action == "remove":
-                        cursor.execute(f"CALL hg_remove_query_queue_property('{safe_queue}', '{safe_key}')")
-                        return f"Successfully removed property '{property_key}' from queue '{queue_name}'."
-                    else:
-                        return f"Unknown action '{action}'. Supported: 'set', 'remove'."
-                elif target == "classifier":
-                    if not classifier_name:
-                        return "Error: classifier_name is required when target='classifier'."
-                    safe_classifier = classifier_name.replace("'", "''")
-                    if action == "set":
-                        cursor.execute(
-                            f"CALL hg_set_classifier_rule_condition_value('{safe_queue}', '{safe_classifier}', '{safe_key}', '{safe_value}')"
-                        )
-                        return f"Successfully set classifier '{classifier_name}' rule: {property_key} = '{property_value}'."
-                    elif action == "remove":
-                        cursor.execute(
-                            f"CALL hg_remove_classifier_rule_condition_value('{safe_queue}', '{safe_classifier}', '{safe_key}', '{safe_value}')"
-                        )
-                        return f"Successfully removed classifier '{classifier_name}' rule: {property_key} = '{property_value}'."
-                    else:
-                        return f"Unknown action '{action}'. Supported: 'set', 'remove'."
-                else:
-                    return f"Unknown target '{target}'. Supported: 'queue', 'classifier'."
+                    cursor.execute(f"CALL hg_remove_query_queue_property('{safe_queue}', '{safe_key}')")
+                    return f"Successfully removed property '{property_key}' from queue '{queue_name}'."
+
+                safe_classifier = classifier_name.replace("'", "''")
+                if action == "set":
+                    cursor.execute(
+                        f"CALL hg_set_classifier_rule_condition_value('{safe_queue}', '{safe_classifier}', '{safe_key}', '{safe_value}')"
+                    )
+                    return f"Successfully set classifier '{classifier_name}' rule: {property_key} = '{property_value}'."
+                cursor.execute(
+                    f"CALL hg_remove_classifier_rule_condition_value('{safe_queue}', '{safe_classifier}', '{safe_key}', '{safe_value}')"
+                )
+                return f"Successfully removed classifier '{classifier_name}' rule: {property_key} = '{property_value}'."
     except Exception as e:
         return f"Error setting property: {str(e)}"
 
 
+# Warehouse actions that call a single-argument procedure: action -> (procedure, past tense)
+_WAREHOUSE_STATE_ACTIONS = {
+    "suspend": ("hg_suspend_warehouse", "suspended"),
+    "resume": ("hg_resume_warehouse", "resumed"),
+    "restart": ("hg_restart_warehouse", "restarted"),
+}
+_WAREHOUSE_ACTIONS = (*_WAREHOUSE_STATE_ACTIONS, "rename", "resize")
+
+
 def _manage_warehouse(action, warehouse_name, cu=0, new_name=""):
     """Manage a computing group: suspend, resume, restart, rename, or resize."""
     try:
         action = action.lower().strip()
+        if action not in _WAREHOUSE_ACTIONS:
+            supported = ", ".join(f"'{name}'" for name in _WAREHOUSE_ACTIONS)
+            return f"Unknown action '{action}'. Supported: {supported}."
+        if action == "rename" and not new_name:
+            return "Error: new_name is required for 'rename' action."
+        if action == "resize" and cu <= 0:
+            return "Error: cu must be a positive integer for 'resize' action."
+
         safe_name = warehouse_name.replace("'", "''")
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
-                if action == "suspend":
-                    cursor.execute(f"CALL hg_suspend_warehouse('{safe_name}')")
-                    return f"Successfully suspended warehouse '{warehouse_name}'."
-                elif action == "resume":
-                    cursor.execute(f"CALL hg_resume_warehouse('{safe_name}')")
-                    return f"Successfully resumed warehouse '{warehouse_name}'."
-                elif action == "restart":
-                    cursor.execute(f"CALL hg_restart_warehouse('{safe_name}')")
-                    return f"Successfully restarted warehouse '{warehouse_name}'."
+                if action in _WAREHOUSE_STATE_ACTIONS:
+                    procedure, verb = _WAREHOUSE_STATE_ACTIONS[action]
+                    cursor.execute(f"CALL {procedure}('{safe_name}')")
+                    return f"Successfully {verb} warehouse '{warehouse_name}'."
                 elif action == "rename":
-                    if not new_name:
-                        return "Error: new_name is required for 'rename' action."
                     safe_new = new_name.replace("'", "''")
                     cursor.execute(f"CALL hg_rename_warehouse('{safe_name}', '{safe_new}')")
                     return f"Successfully renamed warehouse '{warehouse_name}' to '{new_name}'."
-                elif action == "resize":
-                    if cu <= 0:
-                        return "Error: cu must be a positive integer for 'resize' action."
+                else:
                     cursor.execute(f"CALL hg_alter_warehouse('{safe_name}', {int(cu)})")
                     return f"Successfully resized warehouse '{warehouse_name}' to {cu} CU."
-                else:
-                    return f"Unknown action '{action}'. Supported: 'suspend', 'resume', 'restart', 'rename', 'resize'."
     except Exception as e:
         return f"Error managing warehouse: {str(e)}"
 
@@ -1539,25 +1641,47 @@ def _get_guc_config(guc_name):
 # ============================================================================
 
 
+def _templated_resource(uri):
+    """Register a blocking URI-template resource so it reads in a worker thread.
+
+    FastMCP runs sync static resources in a thread but calls template handlers
+    directly on the event loop. The undecorated sync function is returned so
+    module-level callers (and the tests) keep calling it synchronously.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def offloaded(*args, **kwargs):
+            return await asyncio.to_thread(fn, *args, **kwargs)
+
+        app.resource(uri)(offloaded)
+        return fn
+
+    return decorator
+
+
 @app.resource("hologres:///schemas")
 def list_schemas() -> str:
     """List all schemas in Hologres database."""
-    schemas = handle_read_resource("list_schemas", get_list_schemas_query())
+    schemas = _read_listing("list_schemas", LIST_SCHEMAS_QUERY)
+    if isinstance(schemas, str):
+        return schemas
     return "\n".join([schema[0] for schema in schemas])
 
 
-@app.resource("hologres:///{schema}/tables")
+@_templated_resource("hologres:///{schema}/tables")
 def list_tables_in_schema(schema: str) -> str:
     """List all tables in a specific schema in Hologres database."""
-    tables = handle_read_resource("list_tables_in_schema", get_list_tables_query(schema))
+    tables = _read_listing("list_tables_in_schema", LIST_TABLES_QUERY, params=[schema])
+    if isinstance(tables, str):
+        return tables
     return "\n".join(['"' + table[0].replace('"', '""') + '"' + table[1] for table in tables])
 
 
-@app.resource("hologres:///{schema}/{table}/ddl")
+@_templated_resource("hologres:///{schema}/{table}/ddl")
 def get_table_ddl(schema: str, table: str) -> str:
     """Get the DDL script of a table in a specific schema in Hologres database."""
-    query = f'SELECT hg_dump_script(\'"{schema}"."{table}"\')'
-    ddl = handle_read_resource("list_ddl", query)
+    ddl = handle_read_resource("list_ddl", TABLE_DDL_QUERY, params=[quote_qualified_name(schema, table)], prepare=True)
 
     if ddl and ddl[0]:
         if "Type: VIEW" in ddl[0][0]:
@@ -1566,49 +1690,22 @@ def get_table_ddl(schema: str, table: str) -> str:
     return f"No DDL found for {schema}.{table}"
 
 
-@app.resource("hologres:///{schema}/{table}/statistic")
+@_templated_resource("hologres:///{schema}/{table}/statistic")
 def get_table_statistics(schema: str, table: str) -> str:
     """Get statistics information of a table in Hologres database."""
-    query = f"""
-        SELECT
-            schema_name,
-            table_name,
-            schema_version,
-            statistic_version,
-            total_rows,
-            analyze_timestamp
-        FROM hologres_statistic.hg_table_statistic
-        WHERE schema_name = '{schema}'
-        AND table_name = '{table}'
-        ORDER BY analyze_timestamp DESC;
-    """
-    rows = handle_read_resource("get_table_statistics", query)
-    if not rows:
+    rows = handle_read_resource("get_table_statistics", TABLE_STATISTIC_QUERY, params=[schema, table], prepare=True)
+    if isinstance(rows, str):
+        return rows
+    # The query aggregates all rows into one pre-formatted cell (NULL when there are none)
+    if not rows or rows[0][0] is None:
         return f"No statistics found for {schema}.{table}"
-
-    headers = ["Schema", "Table", "Schema Version", "Stats Version", "Total Rows", "Analyze Time"]
-    return format_tabular_result(rows, headers)
+    return "\t".join(TABLE_STATISTIC_HEADERS) + "\n" + rows[0][0]
 
 
-@app.resource("hologres:///{schema}/{table}/partitions")
+@_templated_resource("hologres:///{schema}/{table}/partitions")
 def get_table_partitions(schema: str, table: str) -> str:
     """List all partitions of a partitioned table in Hologres database."""
-    query = f"""
-        with inh as (
-            SELECT i.inhrelid, i.inhparent
-            FROM pg_catalog.pg_class c
-            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-            LEFT JOIN pg_catalog.pg_inherits i on c.oid=i.inhparent
-            where n.nspname='{schema}' and c.relname='{table}'
-        )
-        select
-            c.relname as table_name
-        from inh
-        join pg_catalog.pg_class c on inh.inhrelid = c.oid
-        join pg_catalog.pg_namespace n on c.relnamespace = n.oid
-        join pg_partitioned_table p on p.partrelid = inh.inhparent order by table_name;
-    """
-    tables = handle_read_resource("get_table_partitions", query)
+    tables = handle_read_resource("get_table_partitions", TABLE_PARTITIONS_QUERY, params=[schema, table], prepare=True)
     return "\n".join([table[0] for table in tables])
 
 
@@ -1624,23 +1721,20 @@ def get_hg_instance_version() -> str:
 @app.resource("system:///missing_stats_tables")
 def get_missing_stats_tables() -> str:
     """Get tables with missing statistics."""
-    query = f"""
-        SELECT *
-        FROM hologres_statistic.hg_stats_missing
-        WHERE schemaname NOT IN ('{SYSTEM_SCHEMAS_EXCLUDED}')
-        ORDER BY schemaname, tablename;
-    """
-    return _query_resource_as_table("get_missing_stats_tables", query, "No tables found with missing statistics")
+    return _query_resource_as_table(
+        "get_missing_stats_tables", MISSING_STATS_QUERY, "No tables found with missing statistics", cached=True
+    )
 
 
 @app.resource("system:///stat_activity")
 def get_stat_activity() -> str:
     """Get current database activity."""
-    query = "SELECT * FROM hg_stat_activity ORDER BY pid;"
-    return _query_resource_as_table("get_stat_activity", query, "No queries found with current running status")
+    return _query_resource_as_table(
+        "get_stat_activity", STAT_ACTIVITY_QUERY, "No queries found with current running status"
+    )
 
 
-@app.resource("system:///guc_value/{guc_name}")
+@_templated_resource("system:///guc_value/{guc_name}")
 def get_guc_value(guc_name: str) -> str:
     """Get GUC (Grand Unified Configuration) value by name."""
     if not guc_name:
@@ -1656,35 +1750,35 @@ def get_guc_value(guc_name: str) -> str:
     return f"{guc_name}: {rows[0][0]}"
 
 
-@app.resource("system:///query_log/latest/{row_limits}")
+@_templated_resource("system:///query_log/latest/{row_limits}")
 def get_query_log_latest(row_limits: str) -> str:
     """Get latest query log entries."""
-    return _query_log_resource("get_latest_query_log", [], row_limits)
+    return _query_log_resource("get_latest_query_log", [], [], row_limits)
 
 
-@app.resource("system:///query_log/user/{user_name}/{row_limits}")
+@_templated_resource("system:///query_log/user/{user_name}/{row_limits}")
 def get_query_log_user(user_name: str, row_limits: str) -> str:
     """Get query log entries for a specific user."""
     if not user_name:
         return "Username cannot be empty"
-    return _query_log_resource("get_user_query_log", [f"usename = '{user_name}'"], row_limits)
+    return _query_log_resource("get_user_query_log", ["usename = %s"], [user_name], row_limits)
 
 
-@app.resource("system:///query_log/application/{application_name}/{row_limits}")
+@_templated_resource("system:///query_log/application/{application_name}/{row_limits}")
 def get_query_log_application(application_name: str, row_limits: str) -> str:
     """Get query log entries for a specific application."""
     if not application_name:
         return "Application name cannot be empty"
-    return _query_log_resource("get_application_query_log", [f"application_name = '{application_name}'"], row_limits)
+    return _query_log_resource("get_application_query_log", ["application_name = %s"], [application_name], row_limits)
 
 
-@app.resource("system:///query_log/failed/{interval}/{row_limits}")
+@_templated_resource("system:///query_log/failed/{interval}/{row_limits}")
 def get_query_log_failed(interval: str, row_limits: str) -> str:
     """Get failed query log entries within a time interval."""
     if not interval:
         return "Interval cannot be empty"
     return _query_log_resource(
-        "get_failed_query_log", ["status = 'FAILED'", f"query_start >= NOW() - INTERVAL '{interval}'"], row_limits
+        "get_failed_query_log", ["status = 'FAILED'", "query_start >= NOW() - %s::interval"], [interval], row_limits
     )
 
 
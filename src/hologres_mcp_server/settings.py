@@ -3,12 +3,22 @@ Settings module for Hologres MCP Server.
 """
 
 import os
+from functools import lru_cache
 
 SERVER_VERSION = "1.0.3"
 
+# Constant for the process so every pooled session reports the same name
+APPLICATION_NAME = f"hologres-mcp-server-{SERVER_VERSION}"
 
+
+@lru_cache(maxsize=1)
 def get_db_config():
-    """Get database configuration from environment variables."""
+    """Get database configuration from environment variables.
+
+    The environment is read once per process and the result is cached; callers
+    must treat the returned dict as read-only. Use ``get_db_config.cache_clear()``
+    to force a re-read.
+    """
     user = os.getenv("HOLOGRES_USER")
     password = os.getenv("HOLOGRES_PASSWORD")
     options = None
@@ -26,7 +36,7 @@ def get_db_config():
         "password": password,
         "options": options,
         "dbname": os.getenv("HOLOGRES_DATABASE"),
-        "application_name": f"hologres-mcp-server-{SERVER_VERSION}",
+        "application_name": APPLICATION_NAME,
     }
     if not all([config["user"], config["password"], config["dbname"]]):
         raise ValueError("Missing required database configuration.")
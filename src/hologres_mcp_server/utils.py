@@ -1,3 +1,6 @@
+import asyncio
+import csv
+import io
 import re
 import time
 
@@ -19,6 +22,12 @@ DDL_KEYWORDS = ("CREATE", "ALTER", "DROP", "COMMENT ON")
 SYSTEM_SCHEMAS = ("pg_catalog", "information_schema", "hologres", "hologres_statistic", "hologres_streaming_mv")
 SYSTEM_SCHEMAS_EXCLUDED = "', '".join(SYSTEM_SCHEMAS)
 
+# COPY wrapper producing tab-separated output with a header row and NULL markers
+COPY_TSV_TEMPLATE = "COPY ({}) TO STDOUT WITH (FORMAT CSV, HEADER true, DELIMITER E'\\t', NULL 'NULL')"
+
+# Upper bound on rows a single query_log resource read may return
+MAX_QUERY_LOG_ROWS = 10000
+
 # Default connection retry settings
 DEFAULT_RETRY_COUNT = 3
 DEFAULT_RETRY_DELAY = 5  # seconds
@@ -56,6 +65,23 @@ def _get_pool():
     return _connection_pool
 
 
+def open_pool():
+    """Create the connection pool eagerly (called once at server startup)."""
+    return _get_pool()
+
+
+def close_pool():
+    """Close the connection pool on server shutdown; later calls fall back to direct connections."""
+    global _connection_pool
+    pool = _connection_pool
+    _connection_pool = None
+    if pool is not None:
+        try:
+            pool.close()
+        except Exception as e:
+            print(f"Connection pool close failed: {e}")
+
+
 def reset_pool():
     """Reset the pool state (for testing)."""
     global _connection_pool, _pool_init_attempted
@@ -126,12 +152,44 @@ def connect_with_retry(retries=DEFAULT_RETRY_COUNT):
     raise psycopg.Error(f"Failed to connect to Hologres database after retrying: {err_msg}")
 
 
-def handle_read_resource(resource_name, query, with_headers=False):
-    """Handle readResource method."""
+async def async_connect_with_retry(retries=DEFAULT_RETRY_COUNT):
+    """Open a direct async connection, retrying without blocking the event loop."""
+    config = get_db_config()
+    attempt = 0
+    err_msg = ""
+    while attempt <= retries:
+        conn = None
+        try:
+            conn = await psycopg.AsyncConnection.connect(**config, autocommit=True)
+            async with conn.cursor() as cursor:
+                await cursor.execute("SELECT 1;")
+                await cursor.fetchone()
+            return conn
+        except psycopg.Error as e:
+            err_msg = f"Connection failed: {e}"
+            # Connected but the health check failed: don't leak this connection
+            if conn is not None:
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+            attempt += 1
+            if attempt <= retries:
+                print(f"Retrying connection (attempt {attempt + 1} of {retries + 1})...")
+                await asyncio.sleep(DEFAULT_RETRY_DELAY)
+    raise psycopg.Error(f"Failed to connect to Hologres database after retrying: {err_msg}")
+
+
+def handle_read_resource(resource_name, query, with_headers=False, params=None, prepare=None):
+    """Handle readResource method.
+
+    Pass ``prepare=True`` for fixed query templates so each pooled connection
+    parses and plans them once and reuses the server-side prepared statement.
+    """
     try:
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
-                cursor.execute(query)
+                cursor.execute(query, params, prepare=prepare)
                 rows = cursor.fetchall()
                 headers = [desc[0] for desc in cursor.description]
                 if with_headers:
@@ -141,21 +199,60 @@ def handle_read_resource(resource_name, query, with_headers=False):
         return f"Error executing query: {str(e)}"
 
 
-def handle_call_tool(tool_name, query, serverless=False):
-    """Handle callTool method."""
+def handle_copy_resource(resource_name, query, params=None):
+    """Handle readResource by streaming ``query`` through COPY ... TO STDOUT.
+
+    Hologres serializes the rows as tab-separated CSV with a header line, so no
+    per-cell formatting happens in Python. Parameters are bound client-side.
+
+    Returns:
+        tuple of (text, has_rows), or an error string.
+    """
+    copy_query = sql.SQL(COPY_TSV_TEMPLATE).format(sql.SQL(query))
+    try:
+        buf = io.BytesIO()
+        with connect_with_retry() as conn:
+            with conn.cursor() as cursor:
+                with cursor.copy(copy_query, params) as copy:
+                    for data in copy:
+                        buf.write(data)
+        # Decode straight from the buffer, dropping the final row terminator,
+        # instead of copying via getvalue() and again via rstrip().
+        with buf.getbuffer() as view:
+            end = len(view) - 1 if view[-1:] == b"\n" else len(view)
+            text = str(view[:end], "utf-8")
+        return text, "\n" in text
+    except Exception as e:
+        return f"Error executing query: {str(e)}"
+
+
+def handle_call_tool(tool_name, query, serverless=False, params=None, prepare=None, csv_output=False):
+    """Handle callTool method.
+
+    Pass ``csv_output=True`` for tabular results (the SELECT tools) to get RFC 4180
+    quoting. Otherwise rows are joined as-is, so single-column text such as DDL
+    scripts and query plans comes back verbatim.
+    """
     try:
         with connect_with_retry() as conn:
             with conn.cursor() as cursor:
                 if serverless:
                     cursor.execute("set hg_computing_resource='serverless'")
 
-                cursor.execute(query)
+                cursor.execute(query, params, prepare=prepare)
 
                 if tool_name == "gather_hg_table_statistics":
-                    return f"Successfully executed {query}"
+                    query_text = query if isinstance(query, str) else query.as_string(conn)
+                    return f"Successfully executed {query_text}"
 
                 if cursor.description:
                     columns = [desc[0] for desc in cursor.description]
+                    if csv_output:
+                        buf = io.StringIO()
+                        writer = csv.writer(buf, lineterminator="\n")
+                        writer.writerow(columns)
+                        writer.writerows(cursor.fetchall())
+                        return buf.getvalue()[:-1]
                     rows = cursor.fetchall()
                     result = [",".join(map(str, row)) for row in rows]
                     return "\n".join([",".join(columns)] + result)
@@ -274,8 +371,10 @@ def validate_ddl_query(query: str) -> None:
         raise ValueError(f"Query must be a DDL statement ({', '.join(DDL_KEYWORDS)})")
 
 
-def validate_positive_integer(value: str, param_name: str = "Row limits") -> tuple[int, str | None]:
-    """Validate string is a positive integer.
+def validate_positive_integer(
+    value: str | int, param_name: str = "Row limits", max_value: int | None = None
+) -> tuple[int, str | None]:
+    """Validate value (string or int) is a positive integer, optionally no greater than max_value.
 
     Returns:
         tuple of (parsed_value, error_message). If valid, error_message is None.
@@ -284,11 +383,22 @@ def validate_positive_integer(value: str, param_name: str = "Row limits") -> tup
         limit = int(value)
         if limit <= 0:
             return 0, f"{param_name} must be a positive integer"
+        if max_value is not None and limit > max_value:
+            return 0, f"{param_name} must not exceed {max_value}"
         return limit, None
     except ValueError:
         return 0, f"Invalid {param_name.lower()} format, must be an integer"
 
 
+def quote_qualified_name(schema_name: str, table_name: str) -> str:
+    """Return ``"schema"."table"`` with embedded double quotes doubled.
+
+    For functions such as hg_dump_script() that take the relation name as a
+    text argument, so the name can be bound as a parameter.
+    """
+    return ".".join('"' + part.replace('"', '""') + '"' for part in (schema_name, table_name))
+
+
 # ============================================================================
 # Result Formatting Helpers
 # ============================================================================
@@ -296,52 +406,96 @@ def validate_positive_integer(value: str, param_name: str = "Row limits") -> tup
 
 def format_tabular_result(rows: list, headers: list, null_display: str = "NULL") -> str:
     """Format query results as tab-separated values with headers."""
-    result = ["\t".join(headers)]
-    for row in rows:
-        result.append("\t".join(str(val) if val is not None else null_display for val in row))
-    return "\n".join(result)
+    # Hot per-cell loop: bind str and the join method to locals, and join lists
+    # rather than generators (str.join materializes its argument anyway).
+    to_str = str
+    join = "\t".join
+    lines = [join(headers)]
+    lines.extend([join([null_display if val is None else to_str(val) for val in row]) for row in rows])
+    return "\n".join(lines)
 
 
 # ============================================================================
-# Query Generators
+# Query Templates
 # ============================================================================
-
-
-def get_list_schemas_query() -> str:
-    """Return the SQL query for listing schemas."""
-    return f"""
-        SELECT table_schema
-        FROM information_schema.tables
-        WHERE table_schema NOT IN ('{SYSTEM_SCHEMAS_EXCLUDED}')
-        GROUP BY table_schema
-        ORDER BY table_schema;
-    """
-
-
-def get_list_tables_query(schema_name: str) -> str:
-    """Return the SQL query for listing tables in a schema."""
-    return f"""
-        SELECT
-            tab.table_name,
-            CASE WHEN tab.table_type = 'VIEW' THEN ' (view)'
-                WHEN tab.table_type = 'FOREIGN' THEN ' (foreign table)'
-                WHEN p.partrelid IS NOT NULL THEN ' (partitioned table)'
-                ELSE ''
-            END AS table_type_info
-        FROM
-            information_schema.tables AS tab
-        LEFT JOIN pg_class AS cls ON tab.table_name = cls.relname
-        LEFT JOIN pg_namespace AS ns ON tab.table_schema = ns.nspname
-        LEFT JOIN pg_inherits AS inh ON cls.oid = inh.inhrelid
-        LEFT JOIN pg_partitioned_table AS p ON cls.oid = p.partrelid
-        WHERE
-            tab.table_schema NOT IN ('{SYSTEM_SCHEMAS_EXCLUDED}')
-            AND tab.table_schema = '{schema_name}'
-            AND (inh.inhrelid IS NULL OR NOT EXISTS (
-                SELECT 1
-                FROM pg_inherits
-                WHERE inh.inhrelid = pg_inherits.inhrelid
-            ))
-        ORDER BY
-            tab.table_name;
-    """
+# Fixed SQL for the schema/system resources. Values are bound as parameters so
+# the query text never changes and psycopg can reuse a prepared statement.
+
+LIST_SCHEMAS_QUERY = f"""
+    SELECT table_schema
+    FROM information_schema.tables
+    WHERE table_schema NOT IN ('{SYSTEM_SCHEMAS_EXCLUDED}')
+    GROUP BY table_schema
+    ORDER BY table_schema;
+"""
+
+LIST_TABLES_QUERY = f"""
+    SELECT
+        tab.table_name,
+        CASE WHEN tab.table_type = 'VIEW' THEN ' (view)'
+            WHEN tab.table_type = 'FOREIGN' THEN ' (foreign table)'
+            WHEN p.partrelid IS NOT NULL THEN ' (partitioned table)'
+            ELSE ''
+        END AS table_type_info
+    FROM
+        information_schema.tables AS tab
+    LEFT JOIN pg_class AS cls ON tab.table_name = cls.relname
+    LEFT JOIN pg_namespace AS ns ON tab.table_schema = ns.nspname
+    LEFT JOIN pg_inherits AS inh ON cls.oid = inh.inhrelid
+    LEFT JOIN pg_partitioned_table AS p ON cls.oid = p.partrelid
+    WHERE
+        tab.table_schema NOT IN ('{SYSTEM_SCHEMAS_EXCLUDED}')
+        AND tab.table_schema = %s
+        AND (inh.inhrelid IS NULL OR NOT EXISTS (
+            SELECT 1
+            FROM pg_inherits
+            WHERE inh.inhrelid = pg_inherits.inhrelid
+        ))
+    ORDER BY
+        tab.table_name;
+"""
+
+# Rendered server-side into a single tab-separated TEXT value (one line per row).
+TABLE_STATISTIC_QUERY = r"""
+    SELECT string_agg(
+        COALESCE(schema_name::text, 'NULL') || E'\t' ||
+        COALESCE(table_name::text, 'NULL') || E'\t' ||
+        COALESCE(schema_version::text, 'NULL') || E'\t' ||
+        COALESCE(statistic_version::text, 'NULL') || E'\t' ||
+        COALESCE(total_rows::text, 'NULL') || E'\t' ||
+        COALESCE(analyze_timestamp::text, 'NULL'),
+        E'\n' ORDER BY analyze_timestamp DESC
+    )
+    FROM hologres_statistic.hg_table_statistic
+    WHERE schema_name = %s
+    AND table_name = %s;
+"""
+TABLE_STATISTIC_HEADERS = ("Schema", "Table", "Schema Version", "Stats Version", "Total Rows", "Analyze Time")
+
+TABLE_PARTITIONS_QUERY = """
+    with inh as (
+        SELECT i.inhrelid, i.inhparent
+        FROM pg_catalog.pg_class c
+        LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_catalog.pg_inherits i on c.oid=i.inhparent
+        where n.nspname = %s and c.relname = %s
+    )
+    select
+        c.relname as table_name
+    from inh
+    join pg_catalog.pg_class c on inh.inhrelid = c.oid
+    join pg_catalog.pg_namespace n on c.relnamespace = n.oid
+    join pg_partitioned_table p on p.partrelid = inh.inhparent order by table_name;
+"""
+
+MISSING_STATS_QUERY = f"""
+    SELECT *
+    FROM hologres_statistic.hg_stats_missing
+    WHERE schemaname NOT IN ('{SYSTEM_SCHEMAS_EXCLUDED}')
+    ORDER BY schemaname, tablename
+"""
+
+STAT_ACTIVITY_QUERY = "SELECT * FROM hg_stat_activity ORDER BY pid"
+
+# Takes the relation name produced by quote_qualified_name()
+TABLE_DDL_QUERY = "SELECT hg_dump_script(%s)"
@@ -38,6 +38,26 @@ def _reset_connection_pool():
     utils._connection_pool = original_pool
 
 
+@pytest.fixture(autouse=True)
+def _clear_listing_cache():
+    """Start every test with an empty schema/table listing cache."""
+    from hologres_mcp_server.server import invalidate_listing_cache
+
+    invalidate_listing_cache()
+    yield
+    invalidate_listing_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_db_config_cache():
+    """Re-read environment variables in every test (get_db_config is memoized)."""
+    from hologres_mcp_server.settings import get_db_config
+
+    get_db_config.cache_clear()
+    yield
+    get_db_config.cache_clear()
+
+
 # ============================================================================
 # Environment Fixtures (for Unit Tests)
 # ============================================================================
@@ -144,6 +164,14 @@ def mock_env_minimal():
 PATCH_CONNECT = "hologres_mcp_server.server.connect_with_retry"
 """Patch target for connect_with_retry in server.py (used by newer tools)."""
 
+PATCH_ASYNC_CONNECT = "hologres_mcp_server.server.async_connect_with_retry"
+"""Patch target for async_connect_with_retry in server.py (used by the lifespan handler)."""
+
+
+def _sql_text(query):
+    """Render a psycopg ``sql.Composable`` (or a plain string) as SQL text for assertions."""
+    return query if isinstance(query, str) else query.as_string()
+
 
 def _make_mock_conn(fetchone=None, fetchall=None, description=None, rowcount=0):
     """Factory to build a mock connection with cursor for unit tests.
@@ -2,12 +2,15 @@
 Tests to fill coverage gaps in server.py — targeting specific uncovered branches.
 """
 
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from conftest import PATCH_CONNECT, _make_mock_conn
+from conftest import PATCH_ASYNC_CONNECT, PATCH_CONNECT, _make_mock_conn
+from fastmcp import Client
 
 from hologres_mcp_server.server import (
+    app,
     cancel_hg_query,
     get_hg_dynamic_table_refresh_history,
     get_hg_lock_diagnostics,
@@ -38,19 +41,79 @@ class TestValidateConnection:
     """Tests for validate_connection lifespan handler."""
 
     async def test_connection_success(self):
-        mock_conn = MagicMock()
-        with patch(PATCH_CONNECT, return_value=mock_conn):
+        mock_conn = AsyncMock()
+        with patch(PATCH_ASYNC_CONNECT, AsyncMock(return_value=mock_conn)):
             async with validate_connection(MagicMock()) as ctx:
                 assert ctx == {}
-            mock_conn.close.assert_called_once()
+            mock_conn.close.assert_awaited_once()
 
     async def test_connection_failure(self, capsys):
-        with patch(PATCH_CONNECT, side_effect=Exception("refused")):
+        with patch(PATCH_ASYNC_CONNECT, AsyncMock(side_effect=Exception("refused"))):
             async with validate_connection(MagicMock()) as ctx:
                 assert ctx == {}
             captured = capsys.readouterr()
             assert "Warning" in captured.out or "refused" in captured.out
 
+    async def test_pool_opened_on_startup_and_closed_on_shutdown(self):
+        with (
+            patch(PATCH_ASYNC_CONNECT, AsyncMock(return_value=AsyncMock())),
+            patch("hologres_mcp_server.server.open_pool") as mock_open,
+            patch("hologres_mcp_server.server.close_pool") as mock_close,
+        ):
+            async with validate_connection(MagicMock()):
+                mock_open.assert_called_once()
+                mock_close.assert_not_called()
+            mock_close.assert_called_once()
+
+    async def test_pool_open_and_close_run_off_event_loop_thread(self):
+        loop_thread = threading.get_ident()
+        seen = []
+        with (
+            patch(PATCH_ASYNC_CONNECT, AsyncMock(return_value=AsyncMock())),
+            patch("hologres_mcp_server.server.open_pool", side_effect=lambda: seen.append(threading.get_ident())),
+            patch("hologres_mcp_server.server.close_pool", side_effect=lambda: seen.append(threading.get_ident())),
+        ):
+            async with validate_connection(MagicMock()):
+                pass
+        assert len(seen) == 2
+        assert loop_thread not in seen
+
+
+# ============================================================================
+# URI-template resources
+# ============================================================================
+
+
+class TestTemplatedResourcesOffloaded:
+    """Template handlers are sync and blocking, so they must not run on the event loop."""
+
+    @pytest.mark.parametrize(
+        ("uri", "target", "result"),
+        [
+            ("hologres:///public/tables", "handle_read_resource", []),
+            ("system:///guc_value/work_mem", "handle_read_resource", [("64MB",)]),
+            ("system:///query_log/latest/5", "handle_copy_resource", ("query_id\n1", True)),
+        ],
+    )
+    async def test_templated_resource_runs_off_event_loop_thread(self, uri, target, result):
+        loop_thread = threading.get_ident()
+        seen = []
+
+        def record(*args, **kwargs):
+            seen.append(threading.get_ident())
+            return result
+
+        with (
+            patch(PATCH_ASYNC_CONNECT, AsyncMock(return_value=AsyncMock())),
+            patch("hologres_mcp_server.server.open_pool"),
+            patch("hologres_mcp_server.server.close_pool"),
+            patch(f"hologres_mcp_server.server.{target}", side_effect=record),
+        ):
+            async with Client(app) as client:
+                await client.read_resource(uri)
+        assert len(seen) == 1
+        assert loop_thread not in seen
+
 
 # ============================================================================
 # _switch_warehouse branches
@@ -7,6 +7,7 @@ unlike the original 12 tools which delegate to handle_call_tool().
 
 from unittest.mock import MagicMock, patch
 
+import pytest
 from conftest import PATCH_CONNECT, _make_mock_conn
 
 from hologres_mcp_server.server import (
@@ -37,6 +38,7 @@ from hologres_mcp_server.server import (
     set_hg_query_queue_property,
     switch_hg_warehouse,
 )
+from hologres_mcp_server.utils import MAX_QUERY_LOG_ROWS
 
 # ============================================================================
 # Query Performance Analysis
@@ -247,6 +249,14 @@ class TestListHgWarehouses:
             result = list_hg_warehouses()
             assert "No warehouses" in result or "Computing Groups" in result
 
+    def test_queries_are_pipelined(self):
+        conn, cursor = _make_mock_conn(fetchone=("default",), fetchall=[])
+        with patch(PATCH_CONNECT, return_value=conn):
+            list_hg_warehouses()
+        conn.pipeline.assert_called_once()
+        names = [c[0] for c in cursor.method_calls if c[0] in ("execute", "fetchone", "fetchall")]
+        assert names == ["execute", "execute", "fetchone", "fetchall"]
+
 
 class TestSwitchHgWarehouse:
     """Tests for switch_hg_warehouse tool."""
@@ -565,6 +575,16 @@ class TestListHgQueryQueues:
             result = list_hg_query_queues()
             assert "queue1" in result or "Query Queue" in result
 
+    def test_queries_are_pipelined(self):
+        conn, cursor = _make_mock_conn(fetchall=[])
+        cursor.description = [("query_queue_name",)]
+        with patch(PATCH_CONNECT, return_value=conn):
+            list_hg_query_queues()
+        conn.pipeline.assert_called_once()
+        # Both statements are queued before the first result is fetched
+        names = [c[0] for c in cursor.method_calls if c[0] in ("execute", "fetchall")]
+        assert names == ["execute", "execute", "fetchall", "fetchall"]
+
 
 class TestManageHgQueryQueue:
     """Tests for manage_hg_query_queue tool."""
@@ -727,6 +747,34 @@ class TestSetHgQueryQueueProperty:
             assert "Error" in result
 
 
+class TestInputValidatedBeforeConnect:
+    """Invalid tool input is rejected without opening a connection."""
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda: manage_hg_warehouse("invalid_action", "wh1"),
+            lambda: manage_hg_warehouse("rename", "wh1"),
+            lambda: manage_hg_warehouse("resize", "wh1", cu=0),
+            lambda: manage_hg_query_queue("invalid", "q1"),
+            lambda: manage_hg_query_queue("create", "q1", 0, 10),
+            lambda: manage_hg_classifier("update", "q1", "cls1"),
+            lambda: set_hg_query_queue_property("invalid", "q1", "key", "val"),
+            lambda: set_hg_query_queue_property("classifier", "q1", "user_name", "admin"),
+            lambda: set_hg_query_queue_property("queue", "q1", "key", "val", action="update"),
+            lambda: get_hg_slow_queries(limit=0),
+            lambda: get_hg_slow_queries(limit=MAX_QUERY_LOG_ROWS + 1),
+            lambda: get_hg_dynamic_table_refresh_history("public", "dt1", limit=-1),
+            lambda: get_hg_table_info_trend("public", "t1", days=0),
+        ],
+    )
+    def test_no_connection_for_invalid_input(self, call):
+        with patch(PATCH_CONNECT) as mock_connect:
+            result = call()
+        assert "Unknown" in result or "Error" in result
+        mock_connect.assert_not_called()
+
+
 # ============================================================================
 # Security & Configuration
 # ============================================================================
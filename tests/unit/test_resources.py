@@ -22,6 +22,10 @@ from unittest.mock import patch
 import pytest
 
 from hologres_mcp_server.server import (
+    LISTING_CACHE_TTL,
+    create_hg_maxcompute_foreign_table,
+    execute_hg_ddl_sql,
+    gather_hg_table_statistics,
     get_guc_value,
     get_hg_instance_version,
     get_missing_stats_tables,
@@ -33,9 +37,18 @@ from hologres_mcp_server.server import (
     get_table_ddl,
     get_table_partitions,
     get_table_statistics,
+    invalidate_listing_cache,
     list_schemas,
     list_tables_in_schema,
 )
+from hologres_mcp_server.utils import MAX_QUERY_LOG_ROWS, format_tabular_result
+
+PATCH_COPY = "hologres_mcp_server.server.handle_copy_resource"
+
+
+def _copy_result(rows, headers):
+    """Build the (text, has_rows) tuple handle_copy_resource returns for the given rows."""
+    return format_tabular_result(rows, headers), bool(rows)
 
 
 class TestListSchemas:
@@ -91,13 +104,16 @@ class TestListTablesInSchema:
             assert '"orders" (view)' in result
             assert '"external_data" (foreign table)' in result
 
-    def test_schema_parameter_in_query(self):
-        """Test schema parameter is included in query."""
+    def test_schema_parameter_bound(self):
+        """Test schema is bound as a parameter of a prepared template, not embedded in the query."""
         with patch("hologres_mcp_server.server.handle_read_resource", return_value=[]) as mock:
             list_tables_in_schema("analytics")
 
             query = mock.call_args[0][1]
-            assert "analytics" in query
+            assert "analytics" not in query
+            assert "%s" in query
+            assert mock.call_args.kwargs["params"] == ["analytics"]
+            assert mock.call_args.kwargs["prepare"] is True
 
     def test_empty_result(self):
         """Test empty result handling."""
@@ -124,6 +140,116 @@ class TestListTablesInSchema:
             assert '""' in result
 
 
+class TestListingCache:
+    """Tests for the TTL cache in front of the schema/table listing resources."""
+
+    PATCH_READ = "hologres_mcp_server.server.handle_read_resource"
+
+    def test_repeated_reads_hit_cache(self):
+        """Test a second read within the TTL does not query the database."""
+        with patch(self.PATCH_READ, return_value=[("public",)]) as mock:
+            assert list_schemas() == "public"
+            assert list_schemas() == "public"
+
+            assert mock.call_count == 1
+
+    def test_tables_cached_per_schema(self):
+        """Test each schema gets its own cache entry."""
+        with patch(self.PATCH_READ, return_value=[("t", "")]) as mock:
+            list_tables_in_schema("a")
+            list_tables_in_schema("b")
+            list_tables_in_schema("a")
+
+            assert [c.kwargs["params"] for c in mock.call_args_list] == [["a"], ["b"]]
+
+    def test_entry_expires_after_ttl(self):
+        """Test a read after LISTING_CACHE_TTL re-queries the database."""
+        with (
+            patch(self.PATCH_READ, return_value=[("public",)]) as mock,
+            patch("hologres_mcp_server.server.time.monotonic", side_effect=[100.0, 100.0 + LISTING_CACHE_TTL]),
+        ):
+            list_schemas()
+            list_schemas()
+
+            assert mock.call_count == 2
+
+    def test_errors_not_cached(self):
+        """Test an error string is returned as-is and the next read retries."""
+        with patch(self.PATCH_READ, side_effect=["Error executing query: timeout", [("public",)]]) as mock:
+            assert list_schemas() == "Error executing query: timeout"
+            assert list_schemas() == "public"
+
+            assert mock.call_count == 2
+
+    def test_ddl_invalidates_cache(self):
+        """Test running DDL through the server drops cached listings."""
+        with (
+            patch(self.PATCH_READ, side_effect=[[("public",)], [("public",), ("sales",)]]) as mock,
+            patch("hologres_mcp_server.server.handle_call_tool", return_value="Query executed successfully"),
+        ):
+            assert list_schemas() == "public"
+            execute_hg_ddl_sql("CREATE SCHEMA sales")
+            assert list_schemas() == "public\nsales"
+
+            assert mock.call_count == 2
+
+    def test_read_racing_ddl_not_cached(self):
+        """Test rows fetched before an invalidation are returned but not stored."""
+
+        def read_during_ddl(*args, **kwargs):
+            invalidate_listing_cache()  # DDL completes while this read is in flight
+            return [("public",)]
+
+        with patch(self.PATCH_READ, side_effect=read_during_ddl):
+            assert list_schemas() == "public"
+        with patch(self.PATCH_READ, return_value=[("public",), ("sales",)]) as mock:
+            assert list_schemas() == "public\nsales"
+
+            assert mock.call_count == 1
+
+    def test_missing_stats_cached_until_analyze(self):
+        """Test missing_stats_tables is served from cache until ANALYZE runs through the server."""
+        with (
+            patch(PATCH_COPY, return_value=_copy_result([("public", "t1")], ["schema", "table"])) as mock_copy,
+            patch("hologres_mcp_server.server.handle_call_tool", return_value="Successfully executed ANALYZE"),
+        ):
+            first = get_missing_stats_tables()
+            assert get_missing_stats_tables() == first
+            assert mock_copy.call_count == 1
+
+            gather_hg_table_statistics("public", "t1")
+            get_missing_stats_tables()
+            assert mock_copy.call_count == 2
+
+    def test_missing_stats_error_not_cached(self):
+        """Test a COPY error for missing_stats_tables is retried on the next read."""
+        with patch(PATCH_COPY, side_effect=["Error executing query: timeout", _copy_result([], ["schema"])]) as mock:
+            assert get_missing_stats_tables() == "Error executing query: timeout"
+            get_missing_stats_tables()
+
+            assert mock.call_count == 2
+
+    def test_stat_activity_not_cached(self):
+        """Test stat_activity stays live."""
+        with patch(PATCH_COPY, return_value=_copy_result([(1,)], ["pid"])) as mock:
+            get_stat_activity()
+            get_stat_activity()
+
+            assert mock.call_count == 2
+
+    def test_maxcompute_import_invalidates_cache(self):
+        """Test IMPORT FOREIGN SCHEMA through the server drops cached table listings."""
+        with (
+            patch(self.PATCH_READ, side_effect=[[], [("orders", " (foreign table)")]]) as mock,
+            patch("hologres_mcp_server.server.handle_call_tool", return_value="Query executed successfully"),
+        ):
+            assert list_tables_in_schema("public") == ""
+            create_hg_maxcompute_foreign_table("mc_project", ["orders"])
+            assert list_tables_in_schema("public") == '"orders" (foreign table)'
+
+            assert mock.call_count == 2
+
+
 class TestGetTableDdl:
     """Tests for get_table_ddl resource."""
 
@@ -171,13 +297,13 @@ class TestGetTableDdl:
             assert "No DDL found" in result or result == ""
 
     def test_schema_table_parameters(self):
-        """Test schema and table are used in query."""
+        """Test schema and table are bound as a quoted relation name."""
         with patch("hologres_mcp_server.server.handle_read_resource", return_value=[("DDL",)]) as mock:
             get_table_ddl("my_schema", "my_table")
 
-            query = mock.call_args[0][1]
-            assert "my_schema" in query
-            assert "my_table" in query
+            assert mock.call_args[0][1] == "SELECT hg_dump_script(%s)"
+            assert mock.call_args.kwargs["params"] == ['"my_schema"."my_table"']
+            assert mock.call_args.kwargs["prepare"] is True
 
 
 class TestGetTableStatistics:
@@ -186,7 +312,7 @@ class TestGetTableStatistics:
     def test_basic_functionality(self):
         """Test statistics retrieval."""
         mock_result = [
-            ("public", "users", 1, 1, 1000, "2024-01-01 00:00:00"),
+            ("public\tusers\t1\t1\t1000\t2024-01-01 00:00:00",),
         ]
         with patch("hologres_mcp_server.server.handle_read_resource", return_value=mock_result):
             result = get_table_statistics("public", "users")
@@ -202,10 +328,17 @@ class TestGetTableStatistics:
 
             assert "No statistics found" in result
 
+    def test_not_found_aggregate_null(self):
+        """Test the NULL aggregate returned for a table without statistics."""
+        with patch("hologres_mcp_server.server.handle_read_resource", return_value=[(None,)]):
+            result = get_table_statistics("public", "nonexistent")
+
+            assert result == "No statistics found for public.nonexistent"
+
     def test_headers_included(self):
         """Test headers are included in output."""
         mock_result = [
-            ("public", "users", 1, 1, 1000, "2024-01-01"),
+            ("public\tusers\t1\t1\t1000\t2024-01-01",),
         ]
         with patch("hologres_mcp_server.server.handle_read_resource", return_value=mock_result):
             result = get_table_statistics("public", "users")
@@ -215,11 +348,20 @@ class TestGetTableStatistics:
             assert "Table" in result
             assert "Total Rows" in result
 
+    def test_schema_table_bound(self):
+        """Test schema and table are bound to the prepared statistics template."""
+        with patch("hologres_mcp_server.server.handle_read_resource", return_value=[]) as mock:
+            get_table_statistics("public", "users'; DROP TABLE x; --")
+
+            query = mock.call_args[0][1]
+            assert "DROP TABLE" not in query
+            assert mock.call_args.kwargs["params"] == ["public", "users'; DROP TABLE x; --"]
+            assert mock.call_args.kwargs["prepare"] is True
+
     def test_multiple_rows(self):
         """Test multiple statistics rows."""
         mock_result = [
-            ("public", "users", 1, 1, 1000, "2024-01-01"),
-            ("public", "users", 1, 2, 2000, "2024-01-02"),
+            ("public\tusers\t1\t2\t2000\t2024-01-02\npublic\tusers\t1\t1\t1000\t2024-01-01",),
         ]
         with patch("hologres_mcp_server.server.handle_read_resource", return_value=mock_result):
             result = get_table_statistics("public", "users")
@@ -227,6 +369,17 @@ class TestGetTableStatistics:
             # Should have header + 2 data rows
             lines = result.split("\n")
             assert len(lines) == 3
+            assert lines[0] == "Schema\tTable\tSchema Version\tStats Version\tTotal Rows\tAnalyze Time"
+            assert lines[1] == "public\tusers\t1\t2\t2000\t2024-01-02"
+
+    def test_formatting_done_in_sql(self):
+        """Test the query renders rows with string_agg so only one cell is transferred."""
+        with patch("hologres_mcp_server.server.handle_read_resource", return_value=[(None,)]) as mock:
+            get_table_statistics("public", "users")
+
+            query = mock.call_args[0][1]
+            assert "string_agg" in query
+            assert "ORDER BY analyze_timestamp DESC" in query
 
 
 class TestGetTablePartitions:
@@ -251,14 +404,15 @@ class TestGetTablePartitions:
 
             assert result == ""
 
-    def test_schema_table_in_query(self):
-        """Test schema and table are used in query."""
+    def test_schema_table_bound(self):
+        """Test schema and table are bound as query parameters."""
         with patch("hologres_mcp_server.server.handle_read_resource", return_value=[]) as mock:
             get_table_partitions("my_schema", "my_table")
 
             query = mock.call_args[0][1]
-            assert "my_schema" in query
-            assert "my_table" in query
+            assert "my_schema" not in query
+            assert mock.call_args.kwargs["params"] == ["my_schema", "my_table"]
+            assert mock.call_args.kwargs["prepare"] is True
 
 
 class TestGetHgInstanceVersion:
@@ -279,7 +433,7 @@ class TestGetMissingStatsTables:
         """Test missing stats tables when none exist."""
         mock_result = []
         mock_headers = ["schemaname", "tablename"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_missing_stats_tables()
 
             assert "No tables found" in result
@@ -291,7 +445,7 @@ class TestGetMissingStatsTables:
             ("analytics", "events", None, None),
         ]
         mock_headers = ["schemaname", "tablename", "column", "reason"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_missing_stats_tables()
 
             assert "public" in result
@@ -306,7 +460,7 @@ class TestGetStatActivity:
         """Test stat activity when no queries running."""
         mock_result = []
         mock_headers = ["pid", "query", "state"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_stat_activity()
 
             assert "No queries found" in result
@@ -318,7 +472,7 @@ class TestGetStatActivity:
             (1235, "INSERT INTO t VALUES (1)", "idle", None),
         ]
         mock_headers = ["pid", "query", "state", "time"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_stat_activity()
 
             assert "1234" in result
@@ -353,11 +507,23 @@ class TestGetQueryLogLatest:
             (2, "SELECT 2", "SUCCESS", None),
         ]
         mock_headers = ["id", "query", "status", "error"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_query_log_latest("2")
 
             assert "SELECT 1" in result
 
+    def test_limit_bound_as_parameter(self):
+        """Test LIMIT is bound so every row limit shares one query text."""
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id"])) as mock:
+            get_query_log_latest("5")
+            first_query = mock.call_args[0][1]
+            assert mock.call_args.kwargs["params"] == [5]
+
+            get_query_log_latest("50")
+            assert mock.call_args[0][1] == first_query
+            assert "LIMIT %s" in first_query
+            assert mock.call_args.kwargs["params"] == [50]
+
     def test_invalid_limit(self):
         """Test query log with invalid limit."""
         result = get_query_log_latest("abc")
@@ -386,11 +552,21 @@ class TestGetQueryLogUser:
             (1, "SELECT 1", "test_user", None),
         ]
         mock_headers = ["id", "query", "user", "time"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_query_log_user("test_user", "10")
 
             assert "SELECT 1" in result
 
+    def test_username_bound_as_parameter(self):
+        """Test username is bound rather than interpolated into the query."""
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id"])) as mock:
+            get_query_log_user("o'brien", "10")
+
+            query = mock.call_args[0][1]
+            assert "o'brien" not in query
+            assert "usename = %s" in query
+            assert mock.call_args.kwargs["params"] == ["o'brien", 10]
+
     def test_empty_username(self):
         """Test query log with empty username."""
         result = get_query_log_user("", "10")
@@ -407,11 +583,19 @@ class TestGetQueryLogApplication:
             (1, "SELECT 1", "my_app", None),
         ]
         mock_headers = ["id", "query", "app", "time"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_query_log_application("my_app", "10")
 
             assert "SELECT 1" in result
 
+    def test_application_name_bound_as_parameter(self):
+        """Test application name is bound rather than interpolated into the query."""
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id"])) as mock:
+            get_query_log_application("my_app", "10")
+
+            assert "application_name = %s" in mock.call_args[0][1]
+            assert mock.call_args.kwargs["params"] == ["my_app", 10]
+
     def test_empty_application_name(self):
         """Test query log with empty application name."""
         result = get_query_log_application("", "10")
@@ -428,11 +612,21 @@ class TestGetQueryLogFailed:
             (1, "SELECT bad", "FAILED", "syntax error"),
         ]
         mock_headers = ["id", "query", "status", "error"]
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
             result = get_query_log_failed("1 day", "10")
 
             assert "SELECT bad" in result
 
+    def test_interval_bound_as_parameter(self):
+        """Test interval is bound and cast server-side instead of embedded as a literal."""
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id"])) as mock:
+            get_query_log_failed("1 day", "10")
+
+            query = mock.call_args[0][1]
+            assert "%s::interval" in query
+            assert "status = 'FAILED'" in query
+            assert mock.call_args.kwargs["params"] == ["1 day", 10]
+
     def test_empty_interval(self):
         """Test failed query log with empty interval."""
         result = get_query_log_failed("", "10")
@@ -512,8 +706,7 @@ class TestResourceErrorHandling:
         ):
             result = get_table_statistics("public", "users")
 
-            # The error string is iterated, creating a header with the error
-            assert isinstance(result, str)
+            assert result == "Error executing query: permission denied"
 
     def test_get_table_partitions_error(self):
         """Test get_table_partitions with error response."""
@@ -602,17 +795,14 @@ class TestResourceBoundaryConditions:
         assert "cannot be empty" in result
 
     def test_get_query_log_latest_very_large_limit(self):
-        """Test get_query_log_latest with very large limit."""
+        """Test get_query_log_latest rejects a limit beyond MAX_QUERY_LOG_ROWS."""
         very_large_limit = "999999999"
 
-        mock_result = [(1, "SELECT 1", "SUCCESS", None)]
-        mock_headers = ["id", "query", "status", "error"]
-
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+        with patch(PATCH_COPY) as mock_copy:
             result = get_query_log_latest(very_large_limit)
 
-            # Should handle large limit
-            assert "SELECT 1" in result or "No query logs" in result
+            assert "must not exceed" in result
+            mock_copy.assert_not_called()
 
     def test_get_query_log_latest_float_limit(self):
         """Test get_query_log_latest with float limit."""
@@ -630,7 +820,7 @@ class TestResourceBoundaryConditions:
             mock_result = [(1, "SELECT 1", username, None)]
             mock_headers = ["id", "query", "user", "time"]
 
-            with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+            with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
                 result = get_query_log_user(username, "10")
 
                 # Should handle special characters
@@ -644,7 +834,7 @@ class TestResourceBoundaryConditions:
             mock_result = []
             mock_headers = ["id", "query", "status", "error"]
 
-            with patch("hologres_mcp_server.server.handle_read_resource", return_value=(mock_result, mock_headers)):
+            with patch(PATCH_COPY, return_value=_copy_result(mock_result, mock_headers)):
                 result = get_query_log_failed(interval, "10")
 
                 # Should attempt query with the interval
@@ -655,24 +845,24 @@ class TestResourceErrorPaths:
     """Tests for resource error handling paths to achieve 100% coverage."""
 
     def test_get_missing_stats_tables_returns_error_string(self):
-        """Test get_missing_stats_tables when handle_read_resource returns error string.
+        """Test get_missing_stats_tables when handle_copy_resource returns error string.
 
         Covers line 259: isinstance(result, str) path.
         """
         error_msg = "Error executing query: Connection refused"
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=error_msg):
+        with patch(PATCH_COPY, return_value=error_msg):
             result = get_missing_stats_tables()
 
             # Should return the error string directly
             assert result == error_msg
 
     def test_get_stat_activity_returns_error_string(self):
-        """Test get_stat_activity when handle_read_resource returns error string.
+        """Test get_stat_activity when handle_copy_resource returns error string.
 
         Covers line 272: isinstance(result, str) path.
         """
         error_msg = "Error executing query: Permission denied"
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=error_msg):
+        with patch(PATCH_COPY, return_value=error_msg):
             result = get_stat_activity()
 
             # Should return the error string directly
@@ -693,7 +883,7 @@ class TestResourceErrorPaths:
 
         Covers line 303: if not rows path.
         """
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=([], ["id", "query"])):
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id", "query"])):
             result = get_query_log_latest("10")
 
             assert "No query logs found" in result
@@ -703,7 +893,7 @@ class TestResourceErrorPaths:
 
         Covers line 321: if not rows path.
         """
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=([], ["id", "query"])):
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id", "query"])):
             result = get_query_log_user("test_user", "10")
 
             assert "No query logs found" in result
@@ -713,7 +903,7 @@ class TestResourceErrorPaths:
 
         Covers line 339: if not rows path.
         """
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=([], ["id", "query"])):
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id", "query"])):
             result = get_query_log_application("my_app", "10")
 
             assert "No query logs found" in result
@@ -723,7 +913,7 @@ class TestResourceErrorPaths:
 
         Covers line 357: if not rows path.
         """
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=([], ["id", "query"])):
+        with patch(PATCH_COPY, return_value=_copy_result([], ["id", "query"])):
             result = get_query_log_failed("1 day", "10")
 
             assert "No query logs found" in result
@@ -738,12 +928,12 @@ class TestResourceErrorPaths:
         assert "Invalid row limits" in result
 
     def test_get_query_log_user_returns_error_string(self):
-        """Test get_query_log_user when handle_read_resource returns error string.
+        """Test get_query_log_user when handle_copy_resource returns error string.
 
         Covers line 318: isinstance(result, str) path.
         """
         error_msg = "Error executing query: Table not found"
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=error_msg):
+        with patch(PATCH_COPY, return_value=error_msg):
             result = get_query_log_user("test_user", "10")
 
             assert result == error_msg
@@ -758,12 +948,12 @@ class TestResourceErrorPaths:
         assert "Invalid row limits" in result
 
     def test_get_query_log_application_returns_error_string(self):
-        """Test get_query_log_application when handle_read_resource returns error string.
+        """Test get_query_log_application when handle_copy_resource returns error string.
 
         Covers line 336: isinstance(result, str) path.
         """
         error_msg = "Error executing query: Timeout"
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=error_msg):
+        with patch(PATCH_COPY, return_value=error_msg):
             result = get_query_log_application("my_app", "10")
 
             assert result == error_msg
@@ -777,13 +967,28 @@ class TestResourceErrorPaths:
 
         assert "must be a positive integer" in result
 
+    def test_query_log_row_limits_above_cap_rejected(self):
+        """row_limits above MAX_QUERY_LOG_ROWS is rejected before any query runs."""
+        with patch(PATCH_COPY) as mock_copy:
+            result = get_query_log_latest(str(MAX_QUERY_LOG_ROWS + 1))
+
+        assert f"must not exceed {MAX_QUERY_LOG_ROWS}" in result
+        mock_copy.assert_not_called()
+
+    def test_query_log_row_limits_at_cap_allowed(self):
+        """row_limits equal to MAX_QUERY_LOG_ROWS is passed through as the bound LIMIT."""
+        with patch(PATCH_COPY, return_value=_copy_result([(1,)], ["id"])) as mock_copy:
+            get_query_log_latest(str(MAX_QUERY_LOG_ROWS))
+
+        assert mock_copy.call_args.kwargs["params"] == [MAX_QUERY_LOG_ROWS]
+
     def test_get_query_log_failed_returns_error_string(self):
-        """Test get_query_log_failed when handle_read_resource returns error string.
+        """Test get_query_log_failed when handle_copy_resource returns error string.
 
         Covers line 354: isinstance(result, str) path.
         """
         error_msg = "Error executing query: Connection lost"
-        with patch("hologres_mcp_server.server.handle_read_resource", return_value=error_msg):
+        with patch(PATCH_COPY, return_value=error_msg):
             result = get_query_log_failed("1 day", "10")
 
             assert result == error_msg
@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
-from hologres_mcp_server.settings import SERVER_VERSION, get_db_config
+from hologres_mcp_server.settings import APPLICATION_NAME, SERVER_VERSION, get_db_config
 
 
 class TestServerVersion:
@@ -119,12 +119,43 @@ class TestGetDbConfig:
             assert config["password"] == "hologres_password"
             assert config["options"] is None
 
+    def test_get_db_config_is_memoized(self, mock_env_basic):
+        """Test environment is read once and the same config is returned on later calls."""
+        first = get_db_config()
+        with patch.dict(os.environ, {"HOLOGRES_HOST": "other-host"}):
+            second = get_db_config()
+
+        assert second is first
+        assert second["host"] == "test-host.hologres.aliyuncs.com"
+
+    def test_get_db_config_cache_clear_rereads_env(self, mock_env_basic):
+        """Test cache_clear() forces the environment to be read again."""
+        get_db_config()
+        with patch.dict(os.environ, {"HOLOGRES_HOST": "other-host"}):
+            get_db_config.cache_clear()
+            assert get_db_config()["host"] == "other-host"
+
+    def test_get_db_config_error_not_cached(self, mock_env_basic):
+        """Test a missing-configuration error is not cached once the env is fixed."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                get_db_config()
+        assert get_db_config()["dbname"] == "test_db"
+
     def test_get_db_config_application_name_format(self, mock_env_basic):
         """Test application_name format includes version."""
         config = get_db_config()
 
         assert config["application_name"] == f"hologres-mcp-server-{SERVER_VERSION}"
 
+    def test_application_name_is_module_constant(self, mock_env_basic):
+        """Test application_name reuses the module-level APPLICATION_NAME across re-reads."""
+        first = get_db_config()["application_name"]
+        get_db_config.cache_clear()
+
+        assert first is APPLICATION_NAME
+        assert get_db_config()["application_name"] is APPLICATION_NAME
+
     def test_get_db_config_empty_string_values(self):
         """Test that empty string values are treated as missing."""
         env = {
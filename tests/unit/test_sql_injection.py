@@ -5,8 +5,9 @@ Tests verify that SQL injection attempts are properly handled and do not
 allow unauthorized execution of malicious queries.
 
 IMPORTANT: These tests document current behavior and potential security risks.
-The current implementation uses string interpolation for SQL construction,
-which is inherently vulnerable to SQL injection. These tests serve as:
+Several tools still build SQL by string interpolation, which is inherently
+vulnerable to SQL injection; ANALYZE and hg_dump_script quote or bind their
+identifiers. These tests serve as:
 1. Documentation of current behavior
 2. Baseline for future security improvements
 3. Verification that injection attempts don't cause crashes
@@ -14,6 +15,8 @@ which is inherently vulnerable to SQL injection. These tests serve as:
 
 from unittest.mock import MagicMock, patch
 
+from conftest import _sql_text
+
 from hologres_mcp_server.server import (
     call_hg_procedure,
     execute_hg_select_sql,
@@ -55,11 +58,9 @@ class TestSqlInjectionPrevention:
                 # Table name is directly interpolated
                 gather_hg_table_statistics(schema_name="public", table=payload)
 
-                query = mock.call_args[0][1]
-                # Injection payload is included in the SQL
-                assert "ANALYZE" in query
-                # This documents the security risk: payload is in the query
-                assert payload in query
+                query = _sql_text(mock.call_args[0][1])
+                # The payload is confined to a quoted identifier
+                assert query == f'ANALYZE "public"."{payload}"'
 
     def test_injection_in_schema_name(self, sql_injection_payloads):
         """Test SQL injection attempts in schema names."""
@@ -67,8 +68,8 @@ class TestSqlInjectionPrevention:
             with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
                 gather_hg_table_statistics(schema_name=payload, table="users")
 
-                query = mock.call_args[0][1]
-                assert payload in query  # Documents security risk
+                query = _sql_text(mock.call_args[0][1])
+                assert query == f'ANALYZE "{payload}"."users"'
 
     def test_injection_in_guc_name(self, sql_injection_payloads):
         """Test SQL injection attempts in GUC names."""
@@ -202,9 +203,9 @@ class TestSqlInjectionAssertions:
                 # Inject payload as table name
                 result = gather_hg_table_statistics(schema_name="public", table=payload)
 
-                # Assert: The query was formed with the payload
-                query = mock.call_args[0][1]
-                assert payload in query
+                # Assert: The payload was passed as one quoted identifier
+                query = _sql_text(mock.call_args[0][1])
+                assert query == f'ANALYZE "public"."{payload}"'
 
                 # Assert: The result indicates an error (table doesn't exist)
                 # This means the injection didn't create a valid table reference
@@ -276,9 +277,9 @@ class TestSqlInjectionAssertions:
             with patch("hologres_mcp_server.server.handle_call_tool", return_value="Error: syntax error") as mock:
                 result = gather_hg_table_statistics(schema_name="public", table=payload)
 
-                # Assert: Query includes the payload (it's interpolated)
-                query = mock.call_args[0][1]
-                assert payload in query
+                # Assert: The payload is quoted as an identifier, not spliced in as SQL
+                query = _sql_text(mock.call_args[0][1])
+                assert query == f'ANALYZE "public"."{payload}"'
 
                 # Assert: Result indicates error (not successful injection)
                 assert "Error" in result or "syntax" in result.lower()
@@ -294,13 +295,12 @@ class TestSqlInjectionDocumentation:
     """
 
     def test_document_parameter_interpolation(self):
-        """Document that parameters are directly interpolated into SQL."""
+        """Document that ANALYZE identifiers are composed with sql.Identifier."""
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
-            # Show how table name is interpolated
             gather_hg_table_statistics(schema_name="public", table="users")
 
-            query = mock.call_args[0][1]
-            assert query == "ANALYZE public.users"
+            query = _sql_text(mock.call_args[0][1])
+            assert query == 'ANALYZE "public"."users"'
 
     def test_document_special_character_handling(self):
         """Document how special characters in identifiers are handled."""
@@ -314,20 +314,17 @@ class TestSqlInjectionDocumentation:
             with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
                 gather_hg_table_statistics(schema_name="public", table=table_name)
 
-                query = mock.call_args[0][1]
-                # Document: special characters are included as-is
-                assert table_name in query
+                query = _sql_text(mock.call_args[0][1])
+                # Document: special characters stay inside the quoted identifier
+                assert query == f'ANALYZE "public"."{table_name}"'
 
     def test_document_identifier_quoting(self):
-        """Document that identifiers are not automatically quoted."""
+        """Document that the DDL relation name is quoted and bound as a parameter."""
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
-            # Current implementation doesn't quote identifiers
-            show_hg_table_ddl(schema_name="my schema", table="my table")
+            show_hg_table_ddl(schema_name="my schema", table='my "table"')
 
-            query = mock.call_args[0][1]
-            # Note: Spaces are included without quotes
-            assert "my schema" in query
-            assert "my table" in query
+            assert mock.call_args[0][1] == "SELECT hg_dump_script(%s)"
+            assert mock.call_args.kwargs["params"] == ['"my schema"."my ""table"""']
 
 
 class TestSafeIdentifierPatterns:
@@ -345,8 +342,8 @@ class TestSafeIdentifierPatterns:
             with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
                 gather_hg_table_statistics(schema_name=schema, table=table)
 
-                query = mock.call_args[0][1]
-                assert f"ANALYZE {schema}.{table}" == query
+                query = _sql_text(mock.call_args[0][1])
+                assert f'ANALYZE "{schema}"."{table}"' == query
 
     def test_potentially_dangerous_identifiers(self):
         """Test identifiers that could be problematic."""
@@ -358,9 +355,8 @@ class TestSafeIdentifierPatterns:
 
         for schema, table in dangerous_identifiers:
             with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
-                # This documents that dangerous patterns are not filtered
                 gather_hg_table_statistics(schema_name=schema, table=table)
 
-                query = mock.call_args[0][1]
-                # The dangerous content is in the query
-                assert schema in query or table in query
+                query = _sql_text(mock.call_args[0][1])
+                # Dangerous content cannot escape the quoted identifiers
+                assert query == f'ANALYZE "{schema}"."{table}"'
@@ -19,6 +19,7 @@ Tools (12 total):
 from unittest.mock import patch
 
 import pytest
+from conftest import _make_mock_conn, _sql_text
 
 from hologres_mcp_server.server import (
     call_hg_procedure,
@@ -44,7 +45,9 @@ class TestExecuteHgSelectSql:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="result") as mock:
             result = execute_hg_select_sql("SELECT * FROM users")
             assert result == "result"
-            mock.assert_called_once_with("execute_hg_select_sql", "SELECT * FROM users", serverless=False)
+            mock.assert_called_once_with(
+                "execute_hg_select_sql", "SELECT * FROM users", serverless=False, csv_output=True
+            )
 
     def test_valid_select_with_whitespace(self):
         """Test SELECT with leading whitespace."""
@@ -83,7 +86,7 @@ class TestExecuteHgSelectSqlWithServerless:
             result = execute_hg_select_sql_with_serverless("SELECT * FROM large_table")
             assert result == "result"
             mock.assert_called_once_with(
-                "execute_hg_select_sql_with_serverless", "SELECT * FROM large_table", serverless=True
+                "execute_hg_select_sql_with_serverless", "SELECT * FROM large_table", serverless=True, csv_output=True
             )
 
     def test_serverless_flag_passed(self):
@@ -211,16 +214,16 @@ class TestGatherHgTableStatistics:
             result = gather_hg_table_statistics(schema_name="public", table="users")
             assert result == "Successfully ANALYZED"
 
-            # Check the generated query
+            # Check the generated query quotes both identifiers
             call_args = mock.call_args
-            assert "ANALYZE public.users" in call_args[0][1]
+            assert _sql_text(call_args[0][1]) == 'ANALYZE "public"."users"'
 
     def test_schema_in_query(self):
         """Test schema name is included in query."""
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name="my_schema", table="my_table")
 
-            query = mock.call_args[0][1]
+            query = _sql_text(mock.call_args[0][1])
             assert "my_schema" in query
 
     def test_table_in_query(self):
@@ -228,7 +231,7 @@ class TestGatherHgTableStatistics:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name="public", table="orders")
 
-            query = mock.call_args[0][1]
+            query = _sql_text(mock.call_args[0][1])
             assert "orders" in query
 
     def test_serverless_false(self):
@@ -409,15 +412,17 @@ class TestListHgTablesInASchema:
             query = mock.call_args[0][1]
             assert "SELECT" in query
             assert "table_name" in query
-            assert "public" in query
+            assert mock.call_args.kwargs["params"] == ["public"]
 
-    def test_schema_parameter_in_query(self):
-        """Test schema parameter is in query."""
+    def test_schema_parameter_bound(self):
+        """Test schema parameter is bound to the prepared template."""
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="") as mock:
             list_hg_tables_in_a_schema(schema_name="analytics")
 
             query = mock.call_args[0][1]
-            assert "analytics" in query
+            assert "analytics" not in query
+            assert mock.call_args.kwargs["params"] == ["analytics"]
+            assert mock.call_args.kwargs["prepare"] is True
 
     def test_table_type_detection(self):
         """Test table type detection is included in query."""
@@ -440,10 +445,18 @@ class TestShowHgTableDdl:
             result = show_hg_table_ddl(schema_name="public", table="users")
             assert "CREATE TABLE" in result
 
-            query = mock.call_args[0][1]
-            assert "hg_dump_script" in query
-            assert "public" in query
-            assert "users" in query
+            assert mock.call_args[0][1] == "SELECT hg_dump_script(%s)"
+            assert mock.call_args.kwargs["params"] == ['"public"."users"']
+            assert mock.call_args.kwargs["prepare"] is True
+
+    def test_ddl_returned_unquoted(self):
+        """Test the DDL script comes back verbatim, not CSV-quoted, through handle_call_tool."""
+        ddl = 'BEGIN;\nCREATE TABLE "public"."users" (\n    id integer,\n    name text\n);\nEND;'
+        conn, cursor = _make_mock_conn(fetchall=[(ddl,)], description=[("hg_dump_script",)])
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=conn):
+            result = show_hg_table_ddl(schema_name="public", table="users")
+
+        assert result == "hg_dump_script\n" + ddl
 
     def test_view_handling(self):
         """Test VIEW DDL handling."""
@@ -458,13 +471,12 @@ class TestShowHgTableDdl:
                     assert "CREATE VIEW" in result or "my_view" in result
 
     def test_schema_table_in_query(self):
-        """Test schema and table are properly quoted in query."""
+        """Test schema and table are quoted in the bound relation name."""
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="DDL") as mock:
             show_hg_table_ddl(schema_name="my_schema", table="my_table")
 
-            query = mock.call_args[0][1]
-            assert "my_schema" in query
-            assert "my_table" in query
+            query = mock.call_args.kwargs["params"][0]
+            assert query == '"my_schema"."my_table"'
 
 
 class TestToolParameterValidation:
@@ -477,16 +489,16 @@ class TestToolParameterValidation:
             gather_hg_table_statistics(schema_name="", table="users")
 
             # Check that the query was formed with empty schema
-            query = mock.call_args[0][1]
-            assert query == "ANALYZE .users"  # Note: this is a potential SQL issue
+            query = _sql_text(mock.call_args[0][1])
+            assert query == 'ANALYZE ""."users"'  # Hologres rejects the empty identifier
 
     def test_gather_stats_empty_table(self):
         """Test gather_hg_table_statistics with empty table name."""
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name="public", table="")
 
-            query = mock.call_args[0][1]
-            assert query == "ANALYZE public."
+            query = _sql_text(mock.call_args[0][1])
+            assert query == 'ANALYZE "public".""'
 
     def test_gather_stats_very_long_names(self, mock_env_with_long_names):
         """Test gather_hg_table_statistics with very long names."""
@@ -495,7 +507,7 @@ class TestToolParameterValidation:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name=long_name, table=long_name)
 
-            query = mock.call_args[0][1]
+            query = _sql_text(mock.call_args[0][1])
             assert long_name in query
 
     def test_gather_stats_special_characters(self):
@@ -506,7 +518,7 @@ class TestToolParameterValidation:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name=special_schema, table=special_table)
 
-            query = mock.call_args[0][1]
+            query = _sql_text(mock.call_args[0][1])
             assert special_schema in query
             assert special_table in query
 
@@ -517,9 +529,9 @@ class TestToolParameterValidation:
                 # Use injection payload as schema/table name
                 gather_hg_table_statistics(schema_name="public", table=payload)
 
-                query = mock.call_args[0][1]
-                # The payload is directly interpolated - potential security issue
-                assert payload in query or "ANALYZE" in query
+                query = _sql_text(mock.call_args[0][1])
+                # The payload stays inside the quoted table identifier
+                assert query == f'ANALYZE "public"."{payload}"'
 
     def test_call_procedure_empty_name(self):
         """Test call_hg_procedure with empty procedure name."""
@@ -562,8 +574,9 @@ class TestToolParameterValidation:
             list_hg_tables_in_a_schema(schema_name="")
 
             query = mock.call_args[0][1]
-            # Empty schema is embedded in query
-            assert "tab.table_schema = ''" in query
+            # Empty schema is bound as a parameter
+            assert "tab.table_schema = %s" in query
+            assert mock.call_args.kwargs["params"] == [""]
 
 
 class TestToolBoundaryConditions:
@@ -577,7 +590,7 @@ class TestToolBoundaryConditions:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name=unicode_schema, table=unicode_table)
 
-            query = mock.call_args[0][1]
+            query = _sql_text(mock.call_args[0][1])
             # Unicode characters should be preserved in the query
             assert unicode_schema in query
             assert unicode_table in query
@@ -590,9 +603,9 @@ class TestToolBoundaryConditions:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="success") as mock:
             gather_hg_table_statistics(schema_name=schema_with_null, table="users")
 
-            query = mock.call_args[0][1]
-            # Null byte should be in the query (potential truncation risk)
-            assert schema_with_null in query or "public" in query
+            query = _sql_text(mock.call_args[0][1])
+            # Null byte is kept inside the quoted identifier
+            assert query == f'ANALYZE "{schema_with_null}"."users"'
 
     def test_call_procedure_with_none_arguments(self):
         """测试 call_hg_procedure 参数为 None。
@@ -664,10 +677,9 @@ class TestShowHgTableDdlExtended:
         with patch("hologres_mcp_server.server.handle_call_tool", return_value="DDL content") as mock:
             show_hg_table_ddl(schema_name="my-schema", table="table;with;special")
 
-            query = mock.call_args[0][1]
-            # Special characters are included in query
-            assert "my-schema" in query
-            assert "table;with;special" in query
+            query = mock.call_args.kwargs["params"][0]
+            # Special characters stay inside the bound, quoted relation name
+            assert query == '"my-schema"."table;with;special"'
 
     def test_ddl_error_handling(self):
         """Test DDL error handling paths."""
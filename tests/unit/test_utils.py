@@ -3,14 +3,16 @@ Tests for utility functions in utils module.
 
 Functions:
 - connect_with_retry(retries=3)
+- async_connect_with_retry(retries=3)
 - handle_read_resource(resource_name, query, with_headers=False)
+- handle_copy_resource(resource_name, query, params=None)
 - handle_call_tool(tool_name, query, serverless=False)
 - get_view_definition(cursor, schema_name, view_name)
 - get_column_comment(cursor, schema_name, table_name, column_name)
 - try_infer_view_comments(schema_name, view_name)
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import psycopg
 import pytest
@@ -18,11 +20,15 @@ import pytest
 from hologres_mcp_server import utils
 from hologres_mcp_server.utils import (
     _get_pool,
+    async_connect_with_retry,
     connect_with_retry,
+    format_tabular_result,
     get_column_comment,
     get_view_definition,
     handle_call_tool,
+    handle_copy_resource,
     handle_read_resource,
+    quote_qualified_name,
     reset_pool,
     try_infer_view_comments,
 )
@@ -107,6 +113,69 @@ class TestConnectWithRetry:
             assert mock_conn.autocommit is True
 
 
+class TestAsyncConnectWithRetry:
+    """Tests for async_connect_with_retry function."""
+
+    @staticmethod
+    def _make_async_conn():
+        mock_cursor = AsyncMock()
+        mock_cursor.fetchone.return_value = (1,)
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__aenter__ = AsyncMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__aexit__ = AsyncMock(return_value=False)
+        return mock_conn, mock_cursor
+
+    async def test_connect_success_first_attempt(self, mock_env_basic):
+        """Test successful async connection on first attempt."""
+        mock_conn, mock_cursor = self._make_async_conn()
+
+        with patch("psycopg.AsyncConnection.connect", AsyncMock(return_value=mock_conn)) as mock_connect:
+            result = await async_connect_with_retry(retries=3)
+
+            assert result == mock_conn
+            mock_connect.assert_awaited_once()
+            assert mock_connect.call_args.kwargs["autocommit"] is True
+            mock_cursor.execute.assert_awaited_once_with("SELECT 1;")
+
+    async def test_connect_failure_then_success(self, mock_env_basic):
+        """Test async connection succeeds after initial failure without blocking sleep."""
+        mock_conn, _ = self._make_async_conn()
+        connect = AsyncMock(side_effect=[psycopg.Error("Connection failed"), mock_conn])
+
+        with patch("psycopg.AsyncConnection.connect", connect), patch("asyncio.sleep", AsyncMock()) as mock_sleep:
+            with patch("time.sleep") as mock_time_sleep:
+                result = await async_connect_with_retry(retries=3)
+
+                assert result == mock_conn
+                assert connect.await_count == 2
+                mock_sleep.assert_awaited_once()
+                mock_time_sleep.assert_not_called()
+
+    async def test_failed_health_check_closes_connection(self, mock_env_basic):
+        """Test a connection whose SELECT 1 fails is closed before retrying."""
+        bad_conn, bad_cursor = self._make_async_conn()
+        bad_conn.close = AsyncMock()
+        bad_cursor.execute.side_effect = psycopg.Error("server closed the connection")
+        good_conn, _ = self._make_async_conn()
+        connect = AsyncMock(side_effect=[bad_conn, good_conn])
+
+        with patch("psycopg.AsyncConnection.connect", connect), patch("asyncio.sleep", AsyncMock()):
+            result = await async_connect_with_retry(retries=1)
+
+        assert result is good_conn
+        bad_conn.close.assert_awaited_once()
+
+    async def test_connect_all_failures(self, mock_env_basic):
+        """Test async connection fails after all retries exhausted."""
+        connect = AsyncMock(side_effect=psycopg.Error("Connection failed"))
+
+        with patch("psycopg.AsyncConnection.connect", connect), patch("asyncio.sleep", AsyncMock()):
+            with pytest.raises(psycopg.Error, match="Failed to connect"):
+                await async_connect_with_retry(retries=2)
+
+            assert connect.await_count == 3
+
+
 class TestHandleReadResource:
     """Tests for handle_read_resource function."""
 
@@ -145,6 +214,23 @@ class TestHandleReadResource:
             assert rows == [("val1", "val2")]
             assert headers == ["col1", "col2"]
 
+    def test_read_resource_params_and_prepare(self, mock_env_basic):
+        """Test params and prepare flag are forwarded to cursor.execute."""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("col1",)]
+        mock_cursor.fetchall.return_value = [("val1",)]
+
+        mock_conn = MagicMock()
+        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = MagicMock(return_value=False)
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            handle_read_resource("test_resource", "SELECT %s", params=["x"], prepare=True)
+
+            mock_cursor.execute.assert_called_once_with("SELECT %s", ["x"], prepare=True)
+
     def test_read_resource_error_handling(self, mock_env_basic):
         """Test error handling in resource read."""
         with patch("hologres_mcp_server.utils.connect_with_retry", side_effect=Exception("DB Error")):
@@ -171,6 +257,68 @@ class TestHandleReadResource:
             assert result == []
 
 
+class TestHandleCopyResource:
+    """Tests for handle_copy_resource function."""
+
+    @staticmethod
+    def _make_copy_conn(chunks):
+        mock_copy = MagicMock()
+        mock_copy.__iter__.return_value = iter(chunks)
+        mock_cursor = MagicMock()
+        mock_cursor.copy.return_value.__enter__ = MagicMock(return_value=mock_copy)
+        mock_cursor.copy.return_value.__exit__ = MagicMock(return_value=False)
+
+        mock_conn = MagicMock()
+        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = MagicMock(return_value=False)
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+        return mock_conn, mock_cursor
+
+    def test_copy_returns_server_formatted_text(self, mock_env_basic):
+        """Test COPY chunks are concatenated and decoded without per-row formatting."""
+        mock_conn, mock_cursor = self._make_copy_conn([b"id\tname\n1\t", "caf\u00e9\n".encode(), b"2\tNULL\n"])
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            result = handle_copy_resource("test_resource", "SELECT * FROM t WHERE a = %s", params=["x"])
+
+            assert result == ("id\tname\n1\tcaf\u00e9\n2\tNULL", True)
+            copy_query, params = mock_cursor.copy.call_args[0]
+            rendered = copy_query.as_string()
+            assert rendered.startswith("COPY (SELECT * FROM t WHERE a = %s) TO STDOUT")
+            assert "FORMAT CSV" in rendered
+            assert "NULL 'NULL'" in rendered
+            assert params == ["x"]
+
+    def test_copy_header_only_means_no_rows(self, mock_env_basic):
+        """Test a header-only COPY result is reported as empty."""
+        mock_conn, _ = self._make_copy_conn([b"id\tname\n"])
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            assert handle_copy_resource("test_resource", "SELECT 1") == ("id\tname", False)
+
+    def test_copy_strips_only_final_terminator(self, mock_env_basic):
+        """Test a trailing empty-string row survives; only the last newline is dropped."""
+        mock_conn, _ = self._make_copy_conn([b"note\nx\n", b"\n"])
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            assert handle_copy_resource("test_resource", "SELECT note FROM t") == ("note\nx\n", True)
+
+    def test_copy_empty_stream(self, mock_env_basic):
+        """Test a COPY that yields no data decodes to an empty result."""
+        mock_conn, _ = self._make_copy_conn([])
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            assert handle_copy_resource("test_resource", "SELECT 1") == ("", False)
+
+    def test_copy_error_handling(self, mock_env_basic):
+        """Test errors are returned as strings like handle_read_resource."""
+        with patch("hologres_mcp_server.utils.connect_with_retry", side_effect=Exception("DB Error")):
+            result = handle_copy_resource("test_resource", "SELECT 1")
+
+            assert result == "Error executing query: DB Error"
+
+
 class TestHandleCallTool:
     """Tests for handle_call_tool function."""
 
@@ -192,6 +340,40 @@ class TestHandleCallTool:
             assert "col1,col2" in result
             assert "val1,val2" in result
 
+    def test_call_tool_select_quotes_csv_cells(self, mock_env_basic):
+        """Test cells containing commas, quotes or newlines are CSV-quoted."""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("id",), ("note",)]
+        mock_cursor.fetchall.return_value = [(1, "a,b"), (2, 'say "hi"\nbye'), (3, None)]
+
+        mock_conn = MagicMock()
+        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = MagicMock(return_value=False)
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            result = handle_call_tool("execute_hg_select_sql", "SELECT * FROM notes", csv_output=True)
+
+            assert result == 'id,note\n1,"a,b"\n2,"say ""hi""\nbye"\n3,'
+
+    def test_call_tool_text_output_not_csv_quoted(self, mock_env_basic):
+        """Test single-column text (plans) is returned verbatim without csv_output."""
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("QUERY PLAN",)]
+        mock_cursor.fetchall.return_value = [("HashAggregate",), ('  Group Key: a, "B"',)]
+
+        mock_conn = MagicMock()
+        mock_conn.__enter__ = MagicMock(return_value=mock_conn)
+        mock_conn.__exit__ = MagicMock(return_value=False)
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+        with patch("hologres_mcp_server.utils.connect_with_retry", return_value=mock_conn):
+            result = handle_call_tool("get_hg_query_plan", 'EXPLAIN SELECT a, "B" FROM t GROUP BY 1, 2')
+
+            assert result == 'QUERY PLAN\nHashAggregate\n  Group Key: a, "B"'
+
     def test_call_tool_with_serverless(self, mock_env_basic):
         """Test serverless mode sets computing resource."""
         mock_cursor = MagicMock()
@@ -269,6 +451,33 @@ class TestHandleCallTool:
             assert "5 rows affected" in result
 
 
+class TestFormatTabularResult:
+    """Tests for format_tabular_result function."""
+
+    def test_header_and_rows(self):
+        assert format_tabular_result([(1, "a"), (2, "b")], ["id", "name"]) == "id\tname\n1\ta\n2\tb"
+
+    def test_none_rendered_with_null_display(self):
+        assert format_tabular_result([(None, 0)], ["x", "y"]) == "x\ty\nNULL\t0"
+        assert format_tabular_result([(None, "")], ["x", "y"], null_display="") == "x\ty\n\t"
+
+    def test_no_rows_returns_header_only(self):
+        assert format_tabular_result([], ["x"]) == "x"
+
+
+class TestQuoteQualifiedName:
+    """Tests for quote_qualified_name function."""
+
+    def test_quotes_both_parts(self):
+        assert quote_qualified_name("public", "Users") == '"public"."Users"'
+
+    def test_escapes_embedded_double_quotes(self):
+        assert quote_qualified_name('my"schema', 't"') == '"my""schema"."t"""'
+
+    def test_single_quotes_left_for_parameter_binding(self):
+        assert quote_qualified_name("public", "o'brien") == '"public"."o\'brien"'
+
+
 class TestGetViewDefinition:
     """Tests for get_view_definition function."""
 
@@ -1485,6 +1694,42 @@ class TestConnectionPool:
             result = connect_with_retry(retries=1)
             assert result is mock_direct_conn
 
+    def test_open_pool_creates_pool(self, mock_env_basic):
+        """Test open_pool() eagerly initializes the lazy singleton."""
+        mock_pool_instance = MagicMock()
+        mock_psycopg_pool = MagicMock()
+        mock_psycopg_pool.ConnectionPool.return_value = mock_pool_instance
+
+        with patch.dict("sys.modules", {"psycopg_pool": mock_psycopg_pool}):
+            utils._pool_init_attempted = False
+            utils._connection_pool = None
+            assert utils.open_pool() is mock_pool_instance
+
+    def test_close_pool(self):
+        """Test close_pool() closes the pool and stops handing out pooled connections."""
+        mock_pool = MagicMock()
+        utils._pool_init_attempted = True
+        utils._connection_pool = mock_pool
+        utils.close_pool()
+        mock_pool.close.assert_called_once()
+        assert utils._connection_pool is None
+        assert utils._pool_init_attempted is True
+
+    def test_close_pool_without_pool(self):
+        """Test close_pool() is a no-op when no pool was created."""
+        utils._connection_pool = None
+        utils.close_pool()
+        assert utils._connection_pool is None
+
+    def test_close_pool_error_is_swallowed(self, capsys):
+        """Test close_pool() reports but does not raise on close errors."""
+        mock_pool = MagicMock()
+        mock_pool.close.side_effect = Exception("close failed")
+        utils._connection_pool = mock_pool
+        utils.close_pool()
+        assert "close failed" in capsys.readouterr().out
+        assert utils._connection_pool is None
+
     def test_reset_pool(self):
         """Test reset_pool() clears pool state."""
         utils._pool_init_attempted = True